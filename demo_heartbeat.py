@@ -40,18 +40,17 @@ async def demo_heartbeat_system():
     healthy_agent = SMAAgent(fast_period=10, slow_period=20)
     healthy_agent.name = "Healthy_SMA_Agent"
 
-    # Create a mock "failing" agent by patching its generate_signals method
-    failing_agent = SMAAgent(fast_period=5, slow_period=15)
-    failing_agent.name = "Failing_SMA_Agent"
-
-    # Override generate_signals to simulate failure
-    original_generate_signals = failing_agent.generate_signals
+    # Create a mock "failing" agent by overriding its generate_signals method
+    # (agents use __slots__, so methods can't be patched per instance)
+    class FailingSMAAgent(SMAAgent):
+        __slots__ = ()
 
-    async def failing_generate_signals(snapshot):
-        await asyncio.sleep(0.1)  # Simulate some work
-        raise ValueError("Simulated agent failure for demo")
+        async def generate_signals(self, snapshot):
+            await asyncio.sleep(0.1)  # Simulate some work
+            raise ValueError("Simulated agent failure for demo")
 
-    failing_agent.generate_signals = failing_generate_signals
+    failing_agent = FailingSMAAgent(fast_period=5, slow_period=15)
+    failing_agent.name = "Failing_SMA_Agent"
 
     # Create test data
     print("\n3. Generating test market data...")
@@ -5,6 +5,7 @@ Uses httpx_mock for Slack webhook testing and aiosmtplib monkeypatch for email t
 
 import pytest
 import asyncio
+import json
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
@@ -99,16 +100,14 @@ class TestAlertConfig:
         """Test email_enabled property."""
         # Mock email modules to be available
         with patch('tools.alert.aiosmtplib', mock_aiosmtplib):
-            with patch('tools.alert.MIMEText', mock_email):
-                with patch('tools.alert.MIMEMultipart', mock_email):
-                    with patch.dict(os.environ, {
-                        'SMTP_USERNAME': 'test@test.com',
-                        'SMTP_PASSWORD': 'password',
-                        'EMAIL_FROM': 'from@test.com',
-                        'EMAIL_TO': 'to@test.com'
-                    }):
-                        config = AlertConfig()
-                        assert config.email_enabled is True
+            with patch.dict(os.environ, {
+                'SMTP_USERNAME': 'test@test.com',
+                'SMTP_PASSWORD': 'password',
+                'EMAIL_FROM': 'from@test.com',
+                'EMAIL_TO': 'to@test.com'
+            }):
+                config = AlertConfig()
+                assert config.email_enabled is True
         
         # Test without credentials
         with patch.dict(os.environ, {}, clear=True):
@@ -141,7 +140,7 @@ class TestSlackNotifications:
                 mock_httpx_client.post.assert_called_once()
                 call_args = mock_httpx_client.post.call_args
                 assert call_args[0][0] == 'https://hooks.slack.com/test'
-                assert call_args[1]['json']['text'] == 'Test message'
+                assert json.loads(call_args[1]['content'])['text'] == 'Test message'
     
     @pytest.mark.asyncio
     async def test_send_slack_with_metadata(self, mock_httpx_client):
@@ -155,7 +154,7 @@ class TestSlackNotifications:
                 
                 assert result is True
                 call_args = mock_httpx_client.post.call_args
-                payload = call_args[1]['json']
+                payload = json.loads(call_args[1]['content'])
                 assert 'attachments' in payload
                 assert len(payload['attachments']) == 1
                 assert payload['attachments'][0]['color'] == 'good'
@@ -196,52 +195,50 @@ class TestEmailNotifications:
     async def test_send_email_success(self, mock_smtp_server):
         """Test successful email notification."""
         with patch('tools.alert.aiosmtplib') as mock_aiosmtplib:
-            with patch('tools.alert.MIMEText') as mock_mime_text:
-                with patch('tools.alert.MIMEMultipart') as mock_mime_multipart:
-                    with patch.dict(os.environ, {
-                        'SMTP_USERNAME': 'test@test.com',
-                        'SMTP_PASSWORD': 'password',
-                        'EMAIL_FROM': 'from@test.com',
-                        'EMAIL_TO': 'to@test.com'
-                    }):
-                        mock_aiosmtplib.SMTP.return_value.__aenter__.return_value = mock_smtp_server
-                        mock_msg = MagicMock()
-                        mock_mime_multipart.return_value = mock_msg
-                        
-                        result = await send_email("Test message", "Test Subject")
-                        
-                        assert result is True
-                        mock_smtp_server.starttls.assert_called_once()
-                        mock_smtp_server.login.assert_called_once_with('test@test.com', 'password')
-                        mock_smtp_server.send_message.assert_called_once_with(mock_msg)
-    
+            with patch('tools.alert.EmailMessage') as mock_email_message:
+                with patch.dict(os.environ, {
+                    'SMTP_USERNAME': 'test@test.com',
+                    'SMTP_PASSWORD': 'password',
+                    'EMAIL_FROM': 'from@test.com',
+                    'EMAIL_TO': 'to@test.com'
+                }):
+                    mock_aiosmtplib.SMTP.return_value.__aenter__.return_value = mock_smtp_server
+                    mock_msg = MagicMock()
+                    mock_email_message.return_value = mock_msg
+                    
+                    result = await send_email("Test message", "Test Subject")
+                    
+                    assert result is True
+                    mock_smtp_server.starttls.assert_called_once()
+                    mock_smtp_server.login.assert_called_once_with('test@test.com', 'password')
+                    mock_smtp_server.send_message.assert_called_once_with(mock_msg)
+
     @pytest.mark.asyncio
     async def test_send_email_with_metadata(self, mock_smtp_server):
         """Test email notification with metadata."""
         with patch('tools.alert.aiosmtplib') as mock_aiosmtplib:
-            with patch('tools.alert.MIMEText') as mock_mime_text:
-                with patch('tools.alert.MIMEMultipart') as mock_mime_multipart:
-                    with patch.dict(os.environ, {
-                        'SMTP_USERNAME': 'test@test.com',
-                        'SMTP_PASSWORD': 'password',
-                        'EMAIL_FROM': 'from@test.com',
-                        'EMAIL_TO': 'to@test.com'
-                    }):
-                        mock_aiosmtplib.SMTP.return_value.__aenter__.return_value = mock_smtp_server
-                        mock_msg = MagicMock()
-                        mock_mime_multipart.return_value = mock_msg
-                        
-                        metadata = {'symbol': 'AAPL', 'price': 150.0}
-                        result = await send_email("Test message", "Test Subject", metadata)
-                        
-                        assert result is True
-                        # Check that metadata is included in the email body
-                        mock_mime_text.assert_called_once()
-                        body_text = mock_mime_text.call_args[0][0]
-                        assert 'Additional Information:' in body_text
-                        assert 'symbol: AAPL' in body_text
-                        assert 'price: 150.0' in body_text
-    
+            with patch('tools.alert.EmailMessage') as mock_email_message:
+                with patch.dict(os.environ, {
+                    'SMTP_USERNAME': 'test@test.com',
+                    'SMTP_PASSWORD': 'password',
+                    'EMAIL_FROM': 'from@test.com',
+                    'EMAIL_TO': 'to@test.com'
+                }):
+                    mock_aiosmtplib.SMTP.return_value.__aenter__.return_value = mock_smtp_server
+                    mock_msg = MagicMock()
+                    mock_email_message.return_value = mock_msg
+                    
+                    metadata = {'symbol': 'AAPL', 'price': 150.0}
+                    result = await send_email("Test message", "Test Subject", metadata)
+                    
+                    assert result is True
+                    # Check that metadata is included in the email body
+                    mock_msg.set_content.assert_called_once()
+                    body_text = mock_msg.set_content.call_args[0][0]
+                    assert 'Additional Information:' in body_text
+                    assert 'symbol: AAPL' in body_text
+                    assert 'price: 150.0' in body_text
+
     @pytest.mark.asyncio
     async def test_send_email_no_config(self):
         """Test email notification without configuration."""
@@ -253,20 +250,19 @@ class TestEmailNotifications:
     async def test_send_email_smtp_error(self, mock_smtp_server):
         """Test email notification with SMTP error."""
         with patch('tools.alert.aiosmtplib') as mock_aiosmtplib:
-            with patch('tools.alert.MIMEText') as mock_mime_text:
-                with patch('tools.alert.MIMEMultipart') as mock_mime_multipart:
-                    with patch.dict(os.environ, {
-                        'SMTP_USERNAME': 'test@test.com',
-                        'SMTP_PASSWORD': 'password',
-                        'EMAIL_FROM': 'from@test.com',
-                        'EMAIL_TO': 'to@test.com'
-                    }):
-                        mock_aiosmtplib.SMTP.return_value.__aenter__.return_value = mock_smtp_server
-                        mock_smtp_server.send_message.side_effect = Exception("SMTP Error")
-                        
-                        result = await send_email("Test message")
-                        
-                        assert result is False
+            with patch('tools.alert.EmailMessage') as mock_email_message:
+                with patch.dict(os.environ, {
+                    'SMTP_USERNAME': 'test@test.com',
+                    'SMTP_PASSWORD': 'password',
+                    'EMAIL_FROM': 'from@test.com',
+                    'EMAIL_TO': 'to@test.com'
+                }):
+                    mock_aiosmtplib.SMTP.return_value.__aenter__.return_value = mock_smtp_server
+                    mock_smtp_server.send_message.side_effect = Exception("SMTP Error")
+                    
+                    result = await send_email("Test message")
+                    
+                    assert result is False
 
 
 class TestAlertFormatting:
@@ -349,6 +345,35 @@ class TestConvenienceFunctions:
             assert call_args[1]['subject'] == 'Trading Bot - Heartbeat Missed'
             assert call_args[1]['metadata']['type'] == 'heartbeat_missed'
 
+    @pytest.mark.asyncio
+    async def test_send_alert_runs_channels_concurrently(self):
+        """Test send_alert overlaps Slack and email sends and isolates failures."""
+        both_started = asyncio.Event()
+        started = []
+
+        async def fake_slack(message, metadata=None):
+            started.append('slack')
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            return True
+
+        async def fake_email(message, subject="Trading Bot Alert", metadata=None):
+            started.append('email')
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            raise RuntimeError("SMTP down")
+
+        mock_config = MagicMock(slack_enabled=True, email_enabled=True)
+        with patch('tools.alert.config', mock_config):
+            with patch('tools.alert.send_slack', fake_slack):
+                with patch('tools.alert.send_email', fake_email):
+                    result = await send_alert("Test message")
+
+        assert sorted(started) == ['email', 'slack']
+        assert result == {'slack': True, 'email': False}
+
 
 class TestHeartbeatManager:
     """Test heartbeat manager functionality."""
@@ -402,7 +427,53 @@ class TestHeartbeatManager:
             assert status.is_active is False
             assert status.missed_count == 1
             mock_notify.assert_called_once()
-    
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_timeout_notifications_are_bounded(self, heartbeat_manager):
+        """Test missed-heartbeat notifications fan out under the concurrency cap."""
+        heartbeat_manager.max_concurrent_notifications = 2
+        in_flight = 0
+        peak = 0
+
+        async def slow_notify(last_heartbeat, current_time):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        with patch('tools.heartbeat.notify_heartbeat_missed', side_effect=slow_notify) as mock_notify:
+            for i in range(5):
+                await heartbeat_manager.register_source(f"agent_{i}")
+                heartbeat_manager.heartbeats[f"agent_{i}"].last_heartbeat = (
+                    datetime.now() - timedelta(minutes=2)
+                )
+
+            await heartbeat_manager._check_heartbeats()
+
+            assert mock_notify.call_count == 5
+            assert peak == 2
+            assert not heartbeat_manager.get_active_sources()
+
+    @pytest.mark.asyncio
+    async def test_active_and_overdue_indices(self, heartbeat_manager):
+        """Test active/overdue sets track registration, timeouts and recovery."""
+        with patch('tools.heartbeat.notify_heartbeat_missed'):
+            await heartbeat_manager.register_source("fresh")
+            await heartbeat_manager.register_source("stale")
+            heartbeat_manager.heartbeats["stale"].last_heartbeat = datetime.now() - timedelta(minutes=2)
+
+            await heartbeat_manager._check_heartbeats()
+            assert heartbeat_manager.get_active_sources() == {"fresh"}
+            assert heartbeat_manager.get_overdue_sources() == {"stale"}
+
+            await heartbeat_manager.heartbeat("stale")
+            assert heartbeat_manager.get_active_sources() == {"fresh", "stale"}
+            assert heartbeat_manager.get_overdue_sources() == set()
+
+            await heartbeat_manager.deregister_source("fresh")
+            assert heartbeat_manager.get_active_sources() == {"stale"}
+
     @pytest.mark.asyncio
     async def test_start_stop_monitoring(self, heartbeat_manager):
         """Test starting and stopping heartbeat monitoring."""
@@ -458,7 +529,7 @@ class TestIntegrationWithMocks:
                 mock_client.post.assert_called_once()
                 call_args = mock_client.post.call_args
                 assert call_args[0][0] == 'https://hooks.slack.com/test'
-                assert 'Order Fill Summary' in call_args[1]['json']['text']
+                assert 'Order Fill Summary' in json.loads(call_args[1]['content'])['text']
     
     @pytest.mark.asyncio
     async def test_missing_webhook_env_silently_skips(self):
@@ -169,6 +169,24 @@ class TestAgentExecutor:
             assert len(results["Agent1"]) == 1
             assert len(results["Agent2"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_multiple_agents_skips_inactive(self):
+        """Test inactive agents are not executed and report no signals"""
+        active = Mock(spec=SMAAgent)
+        active.name = "Active"
+        active.is_active = True
+        inactive = Mock(spec=SMAAgent)
+        inactive.name = "Inactive"
+        inactive.is_active = False
+
+        with patch.object(self.executor, 'execute_agent_with_heartbeat', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [{"signal": "buy"}]
+
+            results = await self.executor.execute_multiple_agents([active, inactive], {})
+
+            mock_execute.assert_awaited_once_with(active, {})
+            assert results == {"Active": [{"signal": "buy"}], "Inactive": []}
+
 
 class TestSMAAgentHeartbeat:
     """Test SMA Agent heartbeat integration"""
@@ -0,0 +1,156 @@
+"""
+Unit tests for the compiled indicator kernels used by OptimizedTechnicalAgent
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from trading_bot.agents import _indicators_numba as kernels
+
+
+@pytest.fixture
+def market_data():
+    """Deterministic random-walk close/volume series"""
+    rng = np.random.default_rng(42)
+    close = pd.Series(100 + np.cumsum(rng.normal(0, 1, 400)))
+    volume = pd.Series(rng.integers(1000, 10000, 400).astype(float))
+    return close, volume
+
+
+def _pandas_rsi(close, period):
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    avg_gain = gain.ewm(com=period - 1, adjust=True, min_periods=period).mean()
+    avg_loss = loss.ewm(com=period - 1, adjust=True, min_periods=period).mean()
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+class TestComputeAll:
+    """compute_all must reproduce the pandas rolling/ewm chain it replaced"""
+
+    def test_matches_pandas(self, market_data):
+        close, volume = market_data
+        returns = close.pct_change()
+        hist_vol = returns.rolling(21).std() * math.sqrt(252)
+        expected = [
+            close.ewm(span=8, adjust=False).mean(),
+            close.ewm(span=21, adjust=False).mean(),
+            close.ewm(span=55, adjust=False).mean(),
+            close.rolling(20).mean(),
+            close.rolling(50).mean(),
+            close.rolling(20).std(),
+            close.rolling(50).std(),
+            returns.rolling(21).sum(),
+            returns.rolling(63).sum(),
+            returns.rolling(126).sum(),
+            volume.rolling(21).mean(),
+            hist_vol,
+            hist_vol.rolling(63).mean(),
+            hist_vol.rolling(63).std(),
+            _pandas_rsi(close, 14),
+            _pandas_rsi(close, 28),
+        ]
+
+        close_arr = close.to_numpy()
+        actual = kernels.compute_all(close_arr, volume.to_numpy(), kernels.pct_change(close_arr))
+
+        assert len(actual) == len(expected)
+        np.testing.assert_allclose(kernels.pct_change(close_arr), returns.to_numpy())
+        for got, want in zip(actual, expected):
+            np.testing.assert_allclose(got, want.to_numpy(), rtol=1e-9, atol=1e-9)
+
+    def test_short_series_is_all_nan(self):
+        close = np.linspace(100.0, 110.0, 10)
+        sma_20 = kernels.rolling_mean(close, 20)
+        assert np.isnan(sma_20).all()
+
+    def test_rsi_flat_and_rising(self):
+        flat = kernels.price_delta(np.full(30, 100.0))
+        rising = kernels.price_delta(np.arange(30, dtype=np.float64))
+        assert np.isnan(kernels.wilder_rsi(flat, 14)[-1])
+        assert kernels.wilder_rsi(rising, 14)[-1] == 100.0
+
+
+class TestLastWindowMoments:
+    """Scalar skew/kurt must match the last row of pandas rolling moments"""
+
+    def test_matches_pandas_rolling(self, market_data):
+        close, _ = market_data
+        returns = close.pct_change()
+
+        skew, kurt = kernels.last_window_moments(returns.to_numpy(), 63)
+
+        assert skew == pytest.approx(returns.rolling(63).skew().iloc[-1], rel=1e-9)
+        assert kurt == pytest.approx(returns.rolling(63).kurt().iloc[-1], rel=1e-9)
+
+    def test_window_with_nan_is_nan(self):
+        values = np.r_[np.nan, np.linspace(0.0, 1.0, 62)]
+        skew, kurt = kernels.last_window_moments(values, 63)
+        assert np.isnan(skew) and np.isnan(kurt)
+
+
+class TestFastHurst:
+    """fast_hurst must match the polyfit-based estimator on raw arrays"""
+
+    @staticmethod
+    def _reference(close, max_lag=20):
+        lags = range(2, max_lag)
+        tau = [max(1e-8, np.sqrt(np.std(close[lag:] - close[:-lag]))) for lag in lags]
+        return np.polyfit(np.log(lags), np.log(tau), 1)[0]
+
+    def test_matches_polyfit(self, market_data):
+        close, _ = market_data
+        values = close.to_numpy()
+        assert kernels.fast_hurst(values) == pytest.approx(self._reference(values), rel=1e-9)
+
+    def test_short_series_is_neutral(self):
+        assert kernels.fast_hurst(np.linspace(100.0, 110.0, 10)) == 0.5
+
+
+class TestIndicatorState:
+    """Stepping the incremental state must agree with a bulk recompute"""
+
+    @staticmethod
+    def _bulk(close, volume):
+        returns = kernels.pct_change(close)
+        return returns, kernels.compute_all(close, volume, returns)
+
+    def test_step_matches_bulk(self, market_data):
+        from trading_bot.agents.indicator_state import INDICATOR_KEYS, IndicatorState
+
+        # float32 columns, as OptimizedTechnicalAgent stores them with numba
+        close_s, volume_s = market_data
+        close, volume = close_s.to_numpy(np.float32), volume_s.to_numpy(np.float32)
+        index = pd.date_range("2024-01-01", periods=len(close), freq="D")
+
+        returns, arrays = self._bulk(close[:300], volume[:300])
+        state = IndicatorState.from_history(index[299], close[:300], volume[:300], returns, arrays)
+        assert state.resume_position(index, close) == 300
+
+        for i in range(300, len(close)):
+            state.step(index[i], close[i], volume[i])
+
+        _, expected = self._bulk(close, volume)
+        snapshot = state.snapshot()
+        for key, values in zip(INDICATOR_KEYS, expected):
+            assert snapshot[key] == pytest.approx(values[-1], rel=1e-9), key
+            assert np.asarray(snapshot[key]).dtype == np.float64, key
+
+    def test_revised_history_is_not_resumed(self, market_data):
+        from trading_bot.agents.indicator_state import IndicatorState
+
+        close_s, volume_s = market_data
+        close, volume = close_s.to_numpy()[:100], volume_s.to_numpy()[:100]
+        index = pd.date_range("2024-01-01", periods=len(close), freq="D")
+        returns, arrays = self._bulk(close, volume)
+        state = IndicatorState.from_history(index[-1], close, volume, returns, arrays)
+
+        revised = close.copy()
+        revised[-1] += 1.0
+        assert state.resume_position(index, revised) is None
+        assert state.resume_position(index[:-1], close[:-1]) is None
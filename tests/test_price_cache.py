@@ -0,0 +1,102 @@
+"""
+Unit tests for the on-disk price cache
+"""
+
+import os
+import time
+from datetime import date, timedelta
+
+from trading_bot.utils.price_cache import PriceCache
+
+
+RECORDS = [
+    {"time": "2024-01-02", "open": 1.0, "close": 2.0, "high": 2.5, "low": 0.5, "volume": 100},
+    {"time": "2024-01-03", "open": 2.0, "close": 3.0, "high": 3.5, "low": 1.5, "volume": 200},
+]
+
+
+def test_round_trip(tmp_path):
+    cache = PriceCache(cache_dir=str(tmp_path))
+    assert cache.get("AAPL", "2024-01-01", "2024-01-31") is None
+
+    cache.set("AAPL", "2024-01-01", "2024-01-31", RECORDS)
+
+    assert cache.get("AAPL", "2024-01-01", "2024-01-31") == RECORDS
+    assert cache.get("AAPL", "2024-01-01", "2024-02-29") is None
+    assert cache.get("MSFT", "2024-01-01", "2024-01-31") is None
+
+
+def test_open_window_is_not_cached(tmp_path):
+    cache = PriceCache(cache_dir=str(tmp_path))
+    today = date.today().isoformat()
+
+    cache.set("AAPL", "2024-01-01", today, RECORDS)
+
+    assert cache.get("AAPL", "2024-01-01", today) is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_ticker_is_sanitized(tmp_path):
+    cache = PriceCache(cache_dir=str(tmp_path))
+    end = (date.today() - timedelta(days=1)).isoformat()
+
+    cache.set("../BRK/B", "2024-01-01", end, RECORDS)
+
+    assert cache.get("../BRK/B", "2024-01-01", end) == RECORDS
+    assert [p.parent for p in tmp_path.iterdir()] == [tmp_path]
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = PriceCache(cache_dir=str(tmp_path))
+    cache.set("AAPL", "2024-01-01", "2024-01-31", RECORDS)
+    next(tmp_path.iterdir()).write_text("{not json")
+
+    assert cache.get("AAPL", "2024-01-01", "2024-01-31") is None
+
+
+def test_similar_tickers_do_not_collide(tmp_path):
+    cache = PriceCache(cache_dir=str(tmp_path))
+    other = RECORDS[:1]
+
+    cache.set("BRK/B", "2024-01-01", "2024-01-31", RECORDS)
+    cache.set("BRK_B", "2024-01-01", "2024-01-31", other)
+
+    assert cache.get("BRK/B", "2024-01-01", "2024-01-31") == RECORDS
+    assert cache.get("BRK_B", "2024-01-01", "2024-01-31") == other
+
+
+def test_expired_entry_is_a_miss_and_removed(tmp_path):
+    cache = PriceCache(cache_dir=str(tmp_path), ttl_days=90)
+    cache.set("AAPL", "2024-01-01", "2024-01-31", RECORDS)
+    entry = next(tmp_path.iterdir())
+    stale = time.time() - 91 * 86400
+    os.utime(entry, (stale, stale))
+
+    assert cache.get("AAPL", "2024-01-01", "2024-01-31") is None
+    assert not entry.exists()
+
+
+def test_write_prunes_expired_and_excess_entries(tmp_path):
+    cache = PriceCache(cache_dir=str(tmp_path), ttl_days=90, max_entries=2)
+    cache.set("OLD", "2024-01-01", "2024-01-31", RECORDS)
+    stale = time.time() - 91 * 86400
+    os.utime(next(tmp_path.iterdir()), (stale, stale))
+
+    for age, ticker in enumerate(["A", "B", "C"]):
+        cache.set(ticker, "2024-01-01", "2024-01-31", RECORDS)
+        written = max(tmp_path.iterdir(), key=lambda p: p.stat().st_mtime_ns)
+        stamp = time.time() - (3 - age) * 60
+        os.utime(written, (stamp, stamp))
+    cache.prune()
+
+    assert [t for t in ["OLD", "A", "B", "C"] if cache.get(t, "2024-01-01", "2024-01-31")] == ["B", "C"]
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path):
+    cache = PriceCache(cache_dir=str(tmp_path))
+    circular = []
+    circular.append(circular)
+
+    cache.set("AAPL", "2024-01-01", "2024-01-31", circular)
+
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,246 @@
+"""
+Unit tests for SMAAgent's incremental moving-average state
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from trading_bot.agents.sma_agent import SMAAgent
+
+
+def _walk(rng, n):
+    """Random-walk closes, exactly representable in the agent's float32 storage"""
+    return (100 + np.cumsum(rng.normal(0, 1, n))).astype(np.float32).astype(float)
+
+
+def _history(closes):
+    t0 = datetime(2024, 1, 1)
+    return [
+        {'timestamp': (t0 + timedelta(minutes=i)).isoformat(), 'close': float(c), 'volume': 1000}
+        for i, c in enumerate(closes)
+    ]
+
+
+def _expected(closes, fast, slow):
+    series = pd.Series(closes, dtype=float)
+    fast_sma = series.rolling(fast).mean()
+    slow_sma = series.rolling(slow).mean()
+    return fast_sma.iloc[-1], slow_sma.iloc[-1], fast_sma.iloc[-2], slow_sma.iloc[-2]
+
+
+class TestIncrementalSMA:
+    """Appending bars must give the same SMAs as a full recompute"""
+
+    def test_growing_history_matches_rolling(self):
+        rng = np.random.default_rng(7)
+        closes = _walk(rng, 300)
+        agent = SMAAgent(fast_period=5, slow_period=20, min_data_points=30)
+
+        for n in range(30, len(closes), 3):
+            asyncio.run(agent._generate_signal_for_symbol('TEST', {'historical': _history(closes[:n])}, 0))
+            state = agent._sma_state['TEST']
+            got = (state.current_fast, state.current_slow, state.prev_fast, state.prev_slow)
+            assert got == pytest.approx(_expected(closes[:n], 5, 20), rel=1e-12)
+            assert state.last_n == n
+
+    def test_revised_history_is_recomputed(self):
+        rng = np.random.default_rng(11)
+        closes = _walk(rng, 60)
+        agent = SMAAgent(fast_period=5, slow_period=20, min_data_points=30)
+        asyncio.run(agent._generate_signal_for_symbol('TEST', {'historical': _history(closes)}, 0))
+
+        revised = closes.copy()
+        revised[-1] += 5.0
+        revised = np.r_[revised, revised[-1] + 1.0]
+        asyncio.run(agent._generate_signal_for_symbol('TEST', {'historical': _history(revised)}, 0))
+
+        state = agent._sma_state['TEST']
+        got = (state.current_fast, state.current_slow, state.prev_fast, state.prev_slow)
+        assert got == pytest.approx(_expected(revised, 5, 20), rel=1e-12)
+
+
+class TestCrossoverKernel:
+    """The compiled kernel must match the last two rows of rolling().mean()"""
+
+    def test_matches_rolling(self):
+        from trading_bot.agents._sma_kernels import sma_crossover_kernel
+
+        closes = 100 + np.cumsum(np.random.default_rng(3).normal(0, 1, 200))
+        got = sma_crossover_kernel(closes, 10, 50)
+        assert got == pytest.approx(_expected(closes, 10, 50), rel=1e-12)
+
+    def test_short_series_is_nan(self):
+        from trading_bot.agents._sma_kernels import sma_crossover_kernel
+
+        fast_last, slow_last, fast_prev, slow_prev = sma_crossover_kernel(np.arange(20.0), 5, 20)
+        assert fast_last == pytest.approx(17.0) and slow_last == pytest.approx(9.5)
+        assert np.isnan(slow_prev)
+
+    def test_batch_matches_single(self):
+        from trading_bot.agents._sma_kernels import batch_sma_crossover, sma_crossover_kernel
+
+        rng = np.random.default_rng(23)
+        tails = np.zeros((3, 21))
+        lengths = np.array([21, 20, 12])
+        for row, length in enumerate(lengths):
+            tails[row, 21 - length:] = 100 + np.cumsum(rng.normal(0, 1, length))
+
+        batch = batch_sma_crossover(tails, lengths, 5, 20)
+        for row, length in enumerate(lengths):
+            expected = sma_crossover_kernel(tails[row, 21 - length:], 5, 20)
+            np.testing.assert_allclose(batch[row], expected, rtol=1e-12)
+
+    def test_specialized_batch_matches_generic(self):
+        from trading_bot.agents._sma_kernels import batch_sma_crossover, specialized_batch
+
+        rng = np.random.default_rng(29)
+        tails = 100 + np.cumsum(rng.normal(0, 1, (4, 21)), axis=1)
+        lengths = np.array([21, 20, 6, 2])
+        np.testing.assert_array_equal(
+            specialized_batch(5, 20)(tails, lengths), batch_sma_crossover(tails, lengths, 5, 20)
+        )
+
+    def test_batch_crossover_specializes_after_compile(self):
+        from trading_bot.agents import _sma_kernels
+
+        rng = np.random.default_rng(31)
+        tails = 100 + np.cumsum(rng.normal(0, 1, (3, 14)), axis=1)
+        lengths = np.array([14, 9, 3])
+        expected = _sma_kernels.batch_sma_crossover(tails, lengths, 6, 13)
+
+        SMAAgent(fast_period=6, slow_period=13)
+        assert (6, 13) not in _sma_kernels._compiled
+        np.testing.assert_array_equal(_sma_kernels.batch_crossover(tails, lengths, 6, 13), expected)
+
+        _sma_kernels.warmup_specialized(6, 13)
+        assert _sma_kernels._compiled[6, 13] is _sma_kernels.specialized_batch(6, 13)
+        np.testing.assert_array_equal(_sma_kernels.batch_crossover(tails, lengths, 6, 13), expected)
+
+
+def test_fast_sma_matches_rolling():
+    from trading_bot.agents.sma_agent import _fast_sma
+
+    closes = 100 + np.cumsum(np.random.default_rng(5).normal(0, 1, 500))
+    for window in (1, 7, 50, 500, 501):
+        expected = pd.Series(closes).rolling(window).mean().to_numpy()
+        np.testing.assert_allclose(_fast_sma(closes, window), expected, rtol=1e-10)
+
+
+def test_batch_recompute_matches_rolling(monkeypatch):
+    from trading_bot.agents import sma_agent
+
+    monkeypatch.setattr(sma_agent, "HAS_NUMBA", False)
+    rng = np.random.default_rng(9)
+    agent = SMAAgent(fast_period=5, slow_period=20, min_data_points=20)
+    histories = {
+        f"S{n}": _walk(rng, n)
+        for n in (20, 21, 35, 250)
+    }
+
+    cold = {
+        symbol: agent._prepare_symbol(symbol, {'historical': _history(closes)})
+        for symbol, closes in histories.items()
+    }
+    result = agent._full_sma_batch(cold)
+
+    for symbol, closes in histories.items():
+        current_fast, current_slow, prev_fast, prev_slow, price = result[symbol]
+        expected = _expected(closes, 5, 20)
+        assert (current_fast, current_slow, prev_fast) == pytest.approx(expected[:3], rel=1e-12)
+        assert prev_slow == pytest.approx(expected[3], rel=1e-12, nan_ok=True)
+        assert price == closes[-1]
+
+
+def test_sliding_window_stays_incremental():
+    from trading_bot.agents.sma_agent import ColdHistory
+
+    rng = np.random.default_rng(37)
+    closes = _walk(rng, 200)
+    history = _history(closes)
+    agent = SMAAgent(fast_period=5, slow_period=20, min_data_points=30)
+    agent._full_sma_batch({'TEST': agent._prepare_symbol('TEST', {'historical': history[:60]})})
+
+    for end in list(range(61, 120)) + list(range(122, 200, 3)):
+        sma = agent._prepare_symbol('TEST', {'historical': history[end - 60:end]})
+        assert not isinstance(sma, ColdHistory)
+        assert sma[:4] == pytest.approx(_expected(closes[:end], 5, 20), rel=1e-12)
+
+
+def test_pushed_bars_are_not_refolded():
+    rng = np.random.default_rng(13)
+    closes = _walk(rng, 60)
+    history = _history(closes)
+    agent = SMAAgent(fast_period=5, slow_period=20, min_data_points=30)
+    asyncio.run(agent._generate_signal_for_symbol('TEST', {'historical': history[:50]}, 0))
+
+    for bar in history[50:]:
+        asyncio.run(agent.on_bar('TEST', bar))
+    asyncio.run(agent.on_bar('TEST', history[10]))  # stale bar is ignored
+    state = agent._sma_state['TEST']
+    pushes = state.pushes
+
+    sma = agent._prepare_symbol('TEST', {'historical': history})
+    assert state.pushes == pushes
+    assert sma[:4] == pytest.approx(_expected(closes, 5, 20), rel=1e-12)
+
+
+def test_market_snapshot_matches_dict_snapshot():
+    from trading_bot.base_agent import MarketSnapshot
+
+    rng = np.random.default_rng(17)
+    prices = {f"S{i}": {'historical': _history(_walk(rng, 80))} for i in range(6)}
+    positions = {"S0": 100, "S3": -50}
+    snapshot = {'prices': prices, 'positions': positions}
+
+    expected = asyncio.run(SMAAgent(fast_period=3, slow_period=8, min_data_points=10).generate_signals(snapshot))
+    actual = asyncio.run(SMAAgent(fast_period=3, slow_period=8, min_data_points=10).generate_signals(
+        MarketSnapshot.from_dict(snapshot)
+    ))
+    assert actual == expected
+
+
+def test_structured_array_history_matches_records():
+    rng = np.random.default_rng(19)
+    closes = _walk(rng, 90)
+    records = _history(closes)
+    structured = np.array(
+        [(np.datetime64(bar['timestamp']), bar['close']) for bar in records],
+        dtype=[('timestamp', 'M8[ns]'), ('close', 'f8')],
+    )
+
+    from_records = SMAAgent(fast_period=5, slow_period=20, min_data_points=30)
+    from_array = SMAAgent(fast_period=5, slow_period=20, min_data_points=30)
+    for n in (60, 61, 75, 90):
+        expected = from_records._prepare_symbol('TEST', {'historical': records[:n]})
+        actual = from_array._prepare_symbol('TEST', {'historical': structured[:n]})
+        if n == 60:
+            expected = from_records._full_sma_batch({'TEST': expected})['TEST']
+            actual = from_array._full_sma_batch({'TEST': actual})['TEST']
+        assert actual == pytest.approx(expected, rel=1e-12)
+
+
+def test_vectorized_confidence_matches_scalar():
+    fast = np.array([101.0, 99.0, 0.0, 50.0, 100.0, 130.0])
+    slow = np.array([100.0, 100.0, 100.0, 0.0, 100.0, 100.0])
+    agent = SMAAgent()
+    expected = [agent._calculate_confidence(f, s, 'buy') for f, s in zip(fast, slow)]
+    assert SMAAgent._calculate_confidence_vec(fast, slow).tolist() == expected
+
+
+def test_limit_update_resizes_reused_signal():
+    closes = [100.0] * 40 + [90.0] * 5 + [120.0]
+    snapshot = {'prices': {'TEST': {'historical': _history(closes)}}, 'positions': {}}
+    agent = SMAAgent(fast_period=3, slow_period=8, min_data_points=10)
+    agent.set_risk_limits({'max_position_size': 10000})
+
+    first = asyncio.run(agent.generate_signals(snapshot))
+    assert [s['quantity'] for s in first] == [1000]
+
+    asyncio.run(agent.on_limit_update({'max_position_size': 500}))
+    second = asyncio.run(agent.generate_signals(snapshot))
+    assert [s['quantity'] for s in second] == [50]
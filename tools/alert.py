@@ -8,6 +8,7 @@ import asyncio
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime
+from email.message import EmailMessage
 import json
 
 # Optional imports with fallback
@@ -18,15 +19,33 @@ except ImportError:
 
 try:
     import aiosmtplib
-    from email.mime.text import MIMEText
-    from email.mime.multipart import MIMEMultipart
 except ImportError:
     aiosmtplib = None
-    MIMEText = None
-    MIMEMultipart = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"content-type": "application/json"}
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+_HEARTBEAT_MISSED_TEMPLATE = (
+    "⚠️ **Heartbeat Missed Alert**\n"
+    "Last heartbeat: {last}\n"
+    "Current time: {now}\n"
+    "Time elapsed: {minutes} minutes\n"
+    "Status: System may be unresponsive"
+)
+
+
+def _encode_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload to JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str)
+    return json.dumps(payload, default=str).encode("utf-8")
+
 
 class AlertConfig:
     """Configuration for alert system."""
@@ -40,22 +59,14 @@ class AlertConfig:
         self.email_from = os.getenv('EMAIL_FROM')
         self.email_to = os.getenv('EMAIL_TO')
         
-    @property
-    def slack_enabled(self) -> bool:
-        """Check if Slack notifications are enabled."""
-        return bool(self.slack_webhook_url and httpx)
-    
-    @property
-    def email_enabled(self) -> bool:
-        """Check if email notifications are enabled."""
-        return bool(
+        # Resolve channel availability once; send paths only check these flags
+        self.slack_enabled = bool(self.slack_webhook_url and httpx)
+        self.email_enabled = bool(
             self.smtp_username and 
             self.smtp_password and 
             self.email_from and 
             self.email_to and
-            aiosmtplib and 
-            MIMEText and 
-            MIMEMultipart
+            aiosmtplib
         )
 
 
@@ -97,10 +108,14 @@ async def send_slack(message: str, metadata: Optional[Dict[str, Any]] = None) ->
                 ]
             }]
         
+        # Encode once up front so httpx posts the bytes as-is
+        content = _encode_json(payload)
+        
         async with httpx.AsyncClient() as client:
             response = await client.post(
                 config.slack_webhook_url,
-                json=payload,
+                content=content,
+                headers=_JSON_HEADERS,
                 timeout=10.0
             )
             response.raise_for_status()
@@ -130,21 +145,20 @@ async def send_email(message: str, subject: str = "Trading Bot Alert", metadata:
         return False
     
     try:
-        # Create message
-        msg = MIMEMultipart()
-        msg['From'] = config.email_from or ""
-        msg['To'] = config.email_to or ""
-        msg['Subject'] = subject
-        
         # Create email body
         body = f"{message}\n\n"
         if metadata:
             body += "Additional Information:\n"
             for key, value in metadata.items():
                 body += f"  {key}: {value}\n"
-        body += f"\nSent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        body += f"\nSent at: {datetime.now().strftime(_TIMESTAMP_FORMAT)}"
         
-        msg.attach(MIMEText(body, 'plain'))
+        # Plain-text body needs no multipart wrapper
+        msg = EmailMessage()
+        msg['From'] = config.email_from
+        msg['To'] = config.email_to
+        msg['Subject'] = subject
+        msg.set_content(body)
         
         # Send email
         async with aiosmtplib.SMTP(hostname=config.smtp_server, port=config.smtp_port) as server:
@@ -172,8 +186,6 @@ async def send_alert(message: str, subject: str = "Trading Bot Alert", metadata:
     Returns:
         Dict with success status for each channel
     """
-    results = {}
-    
     # Send notifications in parallel
     tasks = []
     
@@ -187,13 +199,17 @@ async def send_alert(message: str, subject: str = "Trading Bot Alert", metadata:
         logger.warning("No notification channels configured")
         return {'slack': False, 'email': False}
     
-    # Execute all tasks
-    for channel, task in tasks:
-        try:
-            results[channel] = await task
-        except Exception as e:
-            logger.error(f"Error sending {channel} notification: {e}")
+    # Execute all tasks concurrently so channel round-trips overlap
+    channels, coros = zip(*tasks)
+    outcomes = await asyncio.gather(*coros, return_exceptions=True)
+    
+    results = {}
+    for channel, outcome in zip(channels, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Error sending {channel} notification: {outcome}")
             results[channel] = False
+        else:
+            results[channel] = outcome
     
     return results
 
@@ -214,15 +230,15 @@ def format_fill_summary(fill: Dict[str, Any]) -> str:
     price = fill.get('price', 0)
     timestamp = fill.get('timestamp', datetime.now())
     
-    message = f"🎯 **Order Fill Summary**\n"
-    message += f"Symbol: {symbol}\n"
-    message += f"Side: {side.upper()}\n"
-    message += f"Quantity: {quantity:,.2f}\n"
-    message += f"Price: ${price:,.2f}\n"
-    message += f"Value: ${(quantity * price):,.2f}\n"
-    message += f"Time: {timestamp}"
-    
-    return message
+    return (
+        "🎯 **Order Fill Summary**\n"
+        f"Symbol: {symbol}\n"
+        f"Side: {side.upper()}\n"
+        f"Quantity: {quantity:,.2f}\n"
+        f"Price: ${price:,.2f}\n"
+        f"Value: ${(quantity * price):,.2f}\n"
+        f"Time: {timestamp}"
+    )
 
 
 def format_heartbeat_missed(last_heartbeat: datetime, current_time: datetime) -> str:
@@ -236,16 +252,13 @@ def format_heartbeat_missed(last_heartbeat: datetime, current_time: datetime) ->
     Returns:
         Formatted message string
     """
-    time_diff = current_time - last_heartbeat
-    minutes = int(time_diff.total_seconds() / 60)
-    
-    message = f"⚠️ **Heartbeat Missed Alert**\n"
-    message += f"Last heartbeat: {last_heartbeat.strftime('%Y-%m-%d %H:%M:%S')}\n"
-    message += f"Current time: {current_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-    message += f"Time elapsed: {minutes} minutes\n"
-    message += f"Status: System may be unresponsive"
+    minutes = int((current_time - last_heartbeat).total_seconds() / 60)
     
-    return message
+    return _HEARTBEAT_MISSED_TEMPLATE.format(
+        last=last_heartbeat.strftime(_TIMESTAMP_FORMAT),
+        now=current_time.strftime(_TIMESTAMP_FORMAT),
+        minutes=minutes,
+    )
 
 
 # Convenience functions for specific notifications
@@ -14,7 +14,7 @@ from .alert import notify_heartbeat_missed
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class HeartbeatStatus:
     """Status of a single heartbeat source."""
     name: str
@@ -23,6 +23,19 @@ class HeartbeatStatus:
     missed_count: int = 0
 
 
+def _status_entry(status: HeartbeatStatus, current_time: datetime, timeout: int) -> Dict:
+    """Status report for one heartbeat source, as returned by get_status()."""
+    minutes_since_last = (current_time - status.last_heartbeat).total_seconds() / 60
+    return {
+        'name': status.name,
+        'last_heartbeat': status.last_heartbeat.isoformat(),
+        'is_active': status.is_active,
+        'missed_count': status.missed_count,
+        'minutes_since_last': minutes_since_last,
+        'is_overdue': minutes_since_last > timeout
+    }
+
+
 class HeartbeatManager:
     """
     Manages heartbeat tracking and notifications.
@@ -37,8 +50,12 @@ class HeartbeatManager:
         """
         self.heartbeat_timeout = heartbeat_timeout
         self.heartbeats: Dict[str, HeartbeatStatus] = {}
+        # Membership indices kept in step with status changes
+        self._active: Set[str] = set()
+        self._overdue: Set[str] = set()
         self.is_running = False
         self.check_interval = 60  # Check every minute
+        self.max_concurrent_notifications = 5  # Cap in-flight alert sends
         self._monitor_task: Optional[asyncio.Task] = None
         
     async def register_source(self, name: str) -> None:
@@ -53,6 +70,7 @@ class HeartbeatManager:
                 name=name,
                 last_heartbeat=datetime.now()
             )
+            self._active.add(name)
             logger.info(f"Registered heartbeat source: {name}")
         
     async def heartbeat(self, name: str) -> None:
@@ -71,6 +89,8 @@ class HeartbeatManager:
         status.last_heartbeat = current_time
         status.is_active = True
         status.missed_count = 0
+        self._active.add(name)
+        self._overdue.discard(name)
         
         logger.debug(f"Heartbeat received from {name} at {current_time}")
         
@@ -83,6 +103,8 @@ class HeartbeatManager:
         """
         if name in self.heartbeats:
             del self.heartbeats[name]
+            self._active.discard(name)
+            self._overdue.discard(name)
             logger.info(f"Deregistered heartbeat source: {name}")
             
     async def start_monitoring(self) -> None:
@@ -126,6 +148,7 @@ class HeartbeatManager:
         """Check all heartbeats for timeouts."""
         current_time = datetime.now()
         timeout_threshold = timedelta(minutes=self.heartbeat_timeout)
+        to_notify = []
         
         for name, status in self.heartbeats.items():
             if not status.is_active:
@@ -142,14 +165,31 @@ class HeartbeatManager:
                 
                 # Send notification (only on first miss to avoid spam)
                 if status.missed_count == 1:
-                    try:
-                        await notify_heartbeat_missed(status.last_heartbeat, current_time)
-                        logger.info(f"Sent heartbeat missed notification for {name}")
-                    except Exception as e:
-                        logger.error(f"Failed to send heartbeat notification for {name}: {e}")
+                    to_notify.append(status)
                 
                 # Mark as inactive after notification
                 status.is_active = False
+                self._active.discard(name)
+                self._overdue.add(name)
+        
+        if not to_notify:
+            return
+        
+        # Fan out notifications so one slow channel doesn't stall the tick
+        semaphore = asyncio.Semaphore(self.max_concurrent_notifications)
+        async with asyncio.TaskGroup() as tg:
+            for status in to_notify:
+                tg.create_task(self._notify_missed(semaphore, status, current_time))
+    
+    async def _notify_missed(self, semaphore: asyncio.Semaphore, status: HeartbeatStatus,
+                             current_time: datetime) -> None:
+        """Send a heartbeat missed notification, bounded by the semaphore."""
+        async with semaphore:
+            try:
+                await notify_heartbeat_missed(status.last_heartbeat, current_time)
+                logger.info(f"Sent heartbeat missed notification for {status.name}")
+            except Exception as e:
+                logger.error(f"Failed to send heartbeat notification for {status.name}: {e}")
                 
     def get_status(self) -> Dict[str, Dict]:
         """
@@ -159,34 +199,18 @@ class HeartbeatManager:
             Dict with status information for each source
         """
         current_time = datetime.now()
-        status_info = {}
-        
-        for name, status in self.heartbeats.items():
-            time_since_last = current_time - status.last_heartbeat
-            status_info[name] = {
-                'name': name,
-                'last_heartbeat': status.last_heartbeat.isoformat(),
-                'is_active': status.is_active,
-                'missed_count': status.missed_count,
-                'minutes_since_last': time_since_last.total_seconds() / 60,
-                'is_overdue': time_since_last.total_seconds() / 60 > self.heartbeat_timeout
-            }
-            
-        return status_info
+        return {
+            name: _status_entry(status, current_time, self.heartbeat_timeout)
+            for name, status in self.heartbeats.items()
+        }
         
     def get_active_sources(self) -> Set[str]:
         """Get set of active heartbeat sources."""
-        return {name for name, status in self.heartbeats.items() if status.is_active}
+        return self._active.copy()
     
     def get_overdue_sources(self) -> Set[str]:
-        """Get set of overdue heartbeat sources."""
-        current_time = datetime.now()
-        timeout_threshold = timedelta(minutes=self.heartbeat_timeout)
-        
-        return {
-            name for name, status in self.heartbeats.items()
-            if (current_time - status.last_heartbeat) > timeout_threshold
-        }
+        """Get set of sources flagged overdue by the last heartbeat check."""
+        return self._overdue.copy()
 
 
 # Global heartbeat manager instance
@@ -21,6 +21,9 @@ except Exception as e:
     print("[enforcer] Missing PyYAML — add to dev deps.")
     raise
 
+# libyaml-backed loader when PyYAML was built with it
+_YLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # -------- rubric defaults (can be overridden later by tools/rubric.yaml) --------
 RUBRIC = {
     "min_score": 9,
@@ -50,13 +53,18 @@ def run(cmd: List[str]) -> str:
 
 
 def git_changed_files(diffbase: str) -> List[str]:
-    out = run(["git", "diff", "--name-only", f"{diffbase}...HEAD"]).splitlines()
-    return [p for p in out if p.strip()]
+    # NUL-separated bytes: no stderr mixed in, newline-safe paths
+    out = subprocess.run(
+        ["git", "diff", "--name-only", "-z", f"{diffbase}...HEAD"],
+        stdout=subprocess.PIPE, check=True,
+    ).stdout
+    return [p.decode() for p in out.split(b"\x00") if p]
 
 
 def load_board(board_path: str) -> Dict[str, Any]:
-    with open(board_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    # Bytes go straight to the parser, which detects the UTF-8 encoding itself
+    with open(board_path, "rb") as f:
+        data = yaml.load(f.read(), Loader=_YLoader)
     # Flatten into id->node mapping
     mapping: Dict[str, Any] = {}
     def add(node: Dict[str, Any]):
@@ -3,17 +3,30 @@
 This package contains all trading agents for the Trading Bot.
 """
 
-# Import core agents that work without numpy
-try:
-    from .sma_agent import SMAAgent, create_sma_agent
-    __all__ = ['SMAAgent', 'create_sma_agent']
-except ImportError as e:
-    print(f"Warning: Could not import SMAAgent: {e}")
-    __all__ = []
+import importlib
+from importlib.util import find_spec
 
-# Import optional agents that require additional dependencies
-try:
-    from .optimized_technicals import OptimizedTechnicalAgent
-    __all__.append('OptimizedTechnicalAgent')
-except ImportError:
-    pass
\ No newline at end of file
+# Core agents work without numpy
+from .sma_agent import SMAAgent, create_sma_agent
+
+__all__ = ['SMAAgent', 'create_sma_agent']
+
+# Optional agents are imported on first attribute access (PEP 562) so that
+# importing the package doesn't pay for numpy/pandas unless they're used.
+_LAZY_AGENTS = {
+    'OptimizedTechnicalAgent': ('.optimized_technicals', ('numpy', 'pandas', 'langchain_core', 'src')),
+}
+
+for _name, (_module, _deps) in _LAZY_AGENTS.items():
+    if all(find_spec(dep) is not None for dep in _deps):
+        __all__.append(_name)
+del _name, _module, _deps
+
+
+def __getattr__(name):
+    if name in _LAZY_AGENTS:
+        module = importlib.import_module(_LAZY_AGENTS[name][0], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
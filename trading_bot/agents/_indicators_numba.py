@@ -0,0 +1,292 @@
+"""
+Numba kernels for OptimizedTechnicalAgent indicator pre-calculation.
+
+Each kernel is a single O(n) pass over a float32 or float64 array (numba
+specializes per dtype; accumulators and outputs are always float64) and
+reproduces the pandas rolling/ewm semantics the agent relied on (NaN
+warm-up, ddof=1 std, adjust=False EMAs). Kernels release the GIL so tickers
+analysed on worker threads run in parallel. Without numba the same
+functions run as plain Python.
+"""
+
+import math
+
+import numpy as np
+
+# Try to import numba for JIT-compiled kernels
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+ANNUALIZATION = math.sqrt(252)
+
+
+@njit(cache=True, nogil=True)
+def pct_change(values):
+    """Equivalent of Series.pct_change(): NaN first, then x[i]/x[i-1] - 1."""
+    n = values.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    out[0] = np.nan
+    for i in range(1, n):
+        out[i] = np.float64(values[i]) / values[i - 1] - 1.0
+    return out
+
+
+@njit(cache=True, nogil=True)
+def ema(values, span):
+    """Equivalent of Series.ewm(span=span, adjust=False).mean()."""
+    n = values.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    alpha = 2.0 / (span + 1.0)
+    prev = np.float64(values[0])
+    out[0] = prev
+    for i in range(1, n):
+        prev = alpha * np.float64(values[i]) + (1.0 - alpha) * prev
+        out[i] = prev
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_sum(values, window):
+    """Equivalent of Series.rolling(window).sum(); NaN inputs poison their windows."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    nan_count = 0
+    for i in range(n):
+        x = np.float64(values[i])
+        if math.isnan(x):
+            nan_count += 1
+        else:
+            total += x
+        if i >= window:
+            old = np.float64(values[i - window])
+            if math.isnan(old):
+                nan_count -= 1
+            else:
+                total -= old
+        if i >= window - 1 and nan_count == 0:
+            out[i] = total
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean(values, window):
+    """Equivalent of Series.rolling(window).mean()."""
+    return rolling_sum(values, window) / window
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_std(values, window):
+    """
+    Series.rolling(window).mean() and .std() from one pass that keeps a
+    running sum and sum of squares; var = (s2 - s*s/w) / (w - 1).
+    """
+    n = values.shape[0]
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+    total = 0.0
+    total_sq = 0.0
+    nan_count = 0
+    for i in range(n):
+        x = np.float64(values[i])
+        if math.isnan(x):
+            nan_count += 1
+        else:
+            total += x
+            total_sq += x * x
+        if i >= window:
+            old = np.float64(values[i - window])
+            if math.isnan(old):
+                nan_count -= 1
+            else:
+                total -= old
+                total_sq -= old * old
+        if i < window - 1:
+            continue
+        if (i + 1) % window == 0:
+            # Re-sum once per window so add/subtract rounding can't accumulate
+            total = 0.0
+            total_sq = 0.0
+            for j in range(i - window + 1, i + 1):
+                v = np.float64(values[j])
+                if not math.isnan(v):
+                    total += v
+                    total_sq += v * v
+        if nan_count == 0:
+            mean_out[i] = total / window
+            var = (total_sq - total * total / window) / (window - 1)
+            std_out[i] = math.sqrt(max(var, 0.0))
+    return mean_out, std_out
+
+
+@njit(cache=True, nogil=True)
+def price_delta(close):
+    """Equivalent of np.diff(close, prepend=close[0]): 0 first, then x[i] - x[i-1]."""
+    n = close.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    out[0] = 0.0
+    for i in range(1, n):
+        out[i] = np.float64(close[i]) - close[i - 1]
+    return out
+
+
+@njit(cache=True, nogil=True)
+def wilder_rsi(delta, period):
+    """
+    RSI from a price-delta array using Wilder smoothing (alpha = 1/period).
+
+    Matches ewm(com=period-1, adjust=True, min_periods=period) on the gain/loss
+    series, so the early bars carry the same bias correction pandas applies.
+    """
+    n = delta.shape[0]
+    out = np.full(n, np.nan)
+    decay = 1.0 - 1.0 / period
+    gain_num = 0.0
+    loss_num = 0.0
+    weight = 0.0
+    for i in range(n):
+        d = delta[i]
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        gain_num = gain + decay * gain_num
+        loss_num = loss + decay * loss_num
+        weight = 1.0 + decay * weight
+        if i >= period - 1:
+            avg_gain = gain_num / weight
+            avg_loss = loss_num / weight
+            if avg_loss > 0:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0:
+                out[i] = 100.0
+    return out
+
+
+@njit(cache=True, nogil=True)
+def compute_all(close, volume, returns):
+    """
+    Compute the rolling/ewm indicator set for one ticker.
+
+    ``returns`` is ``pct_change(close)``. Returns a tuple of float64 arrays
+    aligned with ``close``:
+    (ema_8, ema_21, ema_55, sma_20, sma_50, std_20, std_50,
+     mom_1m, mom_3m, mom_6m, volume_ma_21, hist_vol_21, hist_vol_63_ma,
+     hist_vol_63_std, rsi_14, rsi_28)
+    """
+    sma_20, std_20 = rolling_mean_std(close, 20)
+    sma_50, std_50 = rolling_mean_std(close, 50)
+    hist_vol_21 = rolling_mean_std(returns, 21)[1] * ANNUALIZATION
+    hist_vol_63_ma, hist_vol_63_std = rolling_mean_std(hist_vol_21, 63)
+    delta = price_delta(close)
+    return (
+        ema(close, 8),
+        ema(close, 21),
+        ema(close, 55),
+        sma_20,
+        sma_50,
+        std_20,
+        std_50,
+        rolling_sum(returns, 21),
+        rolling_sum(returns, 63),
+        rolling_sum(returns, 126),
+        rolling_mean(volume, 21),
+        hist_vol_21,
+        hist_vol_63_ma,
+        hist_vol_63_std,
+        wilder_rsi(delta, 14),
+        wilder_rsi(delta, 28),
+    )
+
+
+@njit(cache=True, nogil=True)
+def last_window_moments(values, window):
+    """
+    Sample skewness and excess kurtosis of the final ``window`` values, i.e.
+    what rolling(window).skew()/.kurt() report on the last row.
+    """
+    n = values.shape[0]
+    if n < window:
+        return np.nan, np.nan
+    start = n - window
+    mean = 0.0
+    for i in range(start, n):
+        if math.isnan(values[i]):
+            return np.nan, np.nan
+        mean += values[i]
+    mean /= window
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for i in range(start, n):
+        d = values[i] - mean
+        d2 = d * d
+        m2 += d2
+        m3 += d2 * d
+        m4 += d2 * d2
+    m2 /= window
+    m3 /= window
+    m4 /= window
+    if m2 <= 1e-14:
+        return np.nan, np.nan
+    skew = math.sqrt(window * (window - 1.0)) * m3 / ((window - 2.0) * m2 ** 1.5)
+    kurt = ((window * window - 1.0) * m4 / (m2 * m2) - 3.0 * (window - 1.0) ** 2) / (
+        (window - 2.0) * (window - 3.0)
+    )
+    return skew, kurt
+
+
+@njit(cache=True, nogil=True)
+def fast_hurst(close, max_lag=20):
+    """
+    Hurst exponent from the scaling of lagged price differences: the slope
+    of log(sqrt(std(close[lag:] - close[:-lag]))) against log(lag) for lags
+    2..max_lag-1, fitted by closed-form least squares.
+    """
+    n = close.shape[0]
+    if n < max_lag:
+        return 0.5
+    sx = 0.0
+    sy = 0.0
+    sxx = 0.0
+    sxy = 0.0
+    k = 0
+    for lag in range(2, max_lag):
+        m = n - lag
+        mean = 0.0
+        for i in range(m):
+            mean += np.float64(close[i + lag]) - close[i]
+        mean /= m
+        var = 0.0
+        for i in range(m):
+            d = np.float64(close[i + lag]) - close[i] - mean
+            var += d * d
+        tau = math.sqrt(math.sqrt(var / m))
+        # Floor tau (NaN included) to avoid log(0)
+        if not tau > 1e-8:
+            tau = 1e-8
+        x = math.log(lag)
+        y = math.log(tau)
+        sx += x
+        sy += y
+        sxx += x * x
+        sxy += x * y
+        k += 1
+    denom = k * sxx - sx * sx
+    if denom == 0.0:
+        return 0.5
+    return (k * sxy - sx * sy) / denom
@@ -0,0 +1,147 @@
+"""
+Numba kernels for SMAAgent crossover detection.
+
+A crossover only needs the fast/slow averages on the last two bars, so the
+kernel sums those four windows directly instead of building full rolling
+series. Without numba the same functions run as plain Python.
+"""
+
+import functools
+import threading
+
+import numpy as np
+
+from ._indicators_numba import HAS_NUMBA, njit
+
+try:
+    from numba import prange, typeof
+except ImportError:
+    prange = range
+    typeof = None
+
+
+@njit(cache=True, nogil=True)
+def window_mean(close, end, period):
+    """Mean of close[end - period:end], or NaN if the window doesn't fit."""
+    if period <= 0 or end < period:
+        return np.nan
+    total = 0.0
+    for i in range(end - period, end):
+        total += close[i]
+    return total / period
+
+
+@njit(cache=True, nogil=True)
+def sma_crossover_kernel(close, fast, slow):
+    """
+    Fast/slow SMAs on the last two bars of ``close``, matching the final two
+    rows of rolling(period).mean().
+
+    Returns:
+        (fast_last, slow_last, fast_prev, slow_prev)
+    """
+    n = close.shape[0]
+    return (
+        window_mean(close, n, fast),
+        window_mean(close, n, slow),
+        window_mean(close, n - 1, fast),
+        window_mean(close, n - 1, slow),
+    )
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def batch_sma_crossover(tails, lengths, fast, slow):
+    """
+    sma_crossover_kernel for many symbols at once, rows spread over threads.
+    
+    Row i of ``tails`` holds a symbol's most recent closes right-aligned,
+    with only the last ``lengths[i]`` entries real. Returns an
+    (n_symbols, 4) array of (fast_last, slow_last, fast_prev, slow_prev).
+    """
+    n, width = tails.shape
+    out = np.empty((n, 4))
+    for i in prange(n):
+        fast_last, slow_last, fast_prev, slow_prev = sma_crossover_kernel(
+            tails[i, width - lengths[i]:], fast, slow
+        )
+        out[i, 0] = fast_last
+        out[i, 1] = slow_last
+        out[i, 2] = fast_prev
+        out[i, 3] = slow_prev
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def specialized_batch(fast: int, slow: int):
+    """
+    batch_sma_crossover with ``fast``/``slow`` frozen in as compile-time
+    constants, so the window loops have known trip counts LLVM can unroll.
+    
+    Returns a ``kernel(tails, lengths)``; one is compiled per period pair
+    and shared by every agent using it. Closures can't go in numba's disk
+    cache, so each process compiles its pairs once.
+    """
+    if not HAS_NUMBA:
+        return functools.partial(batch_sma_crossover, fast=fast, slow=slow)
+    
+    @njit(nogil=True, parallel=True)
+    def kernel(tails, lengths):
+        n, width = tails.shape
+        out = np.empty((n, 4))
+        for i in prange(n):
+            close = tails[i, width - lengths[i]:]
+            m = close.shape[0]
+            out[i, 0] = window_mean(close, m, fast)
+            out[i, 1] = window_mean(close, m, slow)
+            out[i, 2] = window_mean(close, m - 1, fast)
+            out[i, 3] = window_mean(close, m - 1, slow)
+        return out
+    
+    return kernel
+
+
+def warmup() -> None:
+    """Compile (or load from cache) the kernels so the first tick doesn't pay for it."""
+    sma_crossover_kernel(np.zeros(4), 1, 2)
+    batch_sma_crossover(np.zeros((1, 4)), np.array([4]), 1, 2)
+
+
+# Period pairs whose specialized kernel is compiled, and those being compiled
+_compiled = {}
+_compiling = set()
+_compile_lock = threading.Lock()
+
+
+def warmup_specialized(fast: int, slow: int) -> None:
+    """
+    Compile the specialized batch kernel for one period pair without running
+    it, so it is safe off the calling thread (numba's workqueue threading
+    layer must not run parallel kernels from two threads at once).
+    """
+    kernel = specialized_batch(fast, slow)
+    if HAS_NUMBA:
+        # Exactly the types _full_sma_batch passes, so calls don't recompile
+        kernel.compile((typeof(np.zeros((1, 1))), typeof(np.zeros(1, dtype=np.int64))))
+    _compiled[fast, slow] = kernel
+
+
+def batch_crossover(tails, lengths, fast: int, slow: int):
+    """
+    batch_sma_crossover through the specialized kernel once it is compiled,
+    otherwise through the generic one. The first call for a period pair
+    starts compiling it on a background thread, so callers on the event
+    loop never wait for numba; every kernel still runs on the caller.
+    """
+    kernel = _compiled.get((fast, slow))
+    if kernel is not None:
+        return kernel(tails, lengths)
+    out = batch_sma_crossover(tails, lengths, fast, slow)
+    if HAS_NUMBA:
+        with _compile_lock:
+            if (fast, slow) not in _compiling:
+                _compiling.add((fast, slow))
+                threading.Thread(
+                    target=warmup_specialized, args=(fast, slow),
+                    name=f"sma-kernel-{fast}-{slow}", daemon=True,
+                ).start()
+    return out
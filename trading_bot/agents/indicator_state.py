@@ -0,0 +1,211 @@
+"""
+Incremental indicator state for OptimizedTechnicalAgent.
+
+When a ticker's history only grows by a few bars between calls, the
+rolling/ewm indicator set can be advanced in O(1) per bar instead of being
+recomputed over the whole series. The values follow the same pandas
+semantics as ``compute_all`` (NaN warm-up, ddof=1 std, adjust=False EMAs,
+adjust=True Wilder averages for RSI).
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ._indicators_numba import ANNUALIZATION
+
+# Last-value keys, in the order compute_all returns its arrays
+INDICATOR_KEYS = (
+    "ema_8_last", "ema_21_last", "ema_55_last",
+    "sma_20_last", "sma_50_last", "std_20_last", "std_50_last",
+    "mom_1m_last", "mom_3m_last", "mom_6m_last", "volume_ma_21_last",
+    "hist_vol_21_last", "hist_vol_63_ma_last", "hist_vol_63_std_last",
+    "rsi_14_last", "rsi_28_last",
+)
+
+
+@dataclass
+class RollingWindow:
+    """Fixed-size window with running sum / sum of squares."""
+    window: int
+    values: deque = field(init=False)
+    total: float = 0.0
+    total_sq: float = 0.0
+    nan_count: int = 0
+    pushes: int = 0
+
+    def __post_init__(self):
+        self.values = deque(maxlen=self.window)
+
+    def push(self, x: float) -> None:
+        if len(self.values) == self.window:
+            old = self.values[0]
+            if math.isnan(old):
+                self.nan_count -= 1
+            else:
+                self.total -= old
+                self.total_sq -= old * old
+        self.values.append(x)
+        if math.isnan(x):
+            self.nan_count += 1
+        else:
+            self.total += x
+            self.total_sq += x * x
+
+        # Re-sum once per window so add/subtract rounding can't accumulate
+        self.pushes += 1
+        if self.pushes % self.window == 0:
+            finite = [v for v in self.values if not math.isnan(v)]
+            self.total = math.fsum(finite)
+            self.total_sq = math.fsum(v * v for v in finite)
+
+    @property
+    def ready(self) -> bool:
+        return len(self.values) == self.window and self.nan_count == 0
+
+    def sum(self) -> float:
+        return self.total if self.ready else math.nan
+
+    def mean(self) -> float:
+        return self.total / self.window if self.ready else math.nan
+
+    def std(self) -> float:
+        if not self.ready:
+            return math.nan
+        var = (self.total_sq - self.total * self.total / self.window) / (self.window - 1)
+        return math.sqrt(max(var, 0.0))
+
+
+@dataclass
+class WilderAverage:
+    """Bias-corrected Wilder gain/loss averages behind one RSI period."""
+    period: int
+    gain_num: float = 0.0
+    loss_num: float = 0.0
+    weight: float = 0.0
+    count: int = 0
+
+    def push(self, delta: float) -> None:
+        decay = 1.0 - 1.0 / self.period
+        self.gain_num = (delta if delta > 0 else 0.0) + decay * self.gain_num
+        self.loss_num = (-delta if delta < 0 else 0.0) + decay * self.loss_num
+        self.weight = 1.0 + decay * self.weight
+        self.count += 1
+
+    def rsi(self) -> float:
+        if self.count < self.period:
+            return math.nan
+        avg_gain = self.gain_num / self.weight
+        avg_loss = self.loss_num / self.weight
+        if avg_loss > 0:
+            return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return 100.0 if avg_gain > 0 else math.nan
+
+
+@dataclass
+class IndicatorState:
+    """Running state needed to advance the indicator set one bar at a time."""
+    last_ts: Any
+    last_close: float
+    ema_8: float
+    ema_21: float
+    ema_55: float
+    close_20: RollingWindow = field(default_factory=lambda: RollingWindow(20))
+    close_50: RollingWindow = field(default_factory=lambda: RollingWindow(50))
+    returns_21: RollingWindow = field(default_factory=lambda: RollingWindow(21))
+    returns_63: RollingWindow = field(default_factory=lambda: RollingWindow(63))
+    returns_126: RollingWindow = field(default_factory=lambda: RollingWindow(126))
+    volume_21: RollingWindow = field(default_factory=lambda: RollingWindow(21))
+    hist_vol_63: RollingWindow = field(default_factory=lambda: RollingWindow(63))
+    rsi_14: WilderAverage = field(default_factory=lambda: WilderAverage(14))
+    rsi_28: WilderAverage = field(default_factory=lambda: WilderAverage(28))
+
+    @classmethod
+    def from_history(cls, last_ts, close, volume, returns, arrays) -> "IndicatorState":
+        """
+        Seed the state from a bulk ``compute_all`` pass.
+
+        Args:
+            last_ts: Timestamp of the final bar
+            close, volume, returns: Column arrays the bulk pass ran on
+            arrays: Tuple returned by compute_all for those columns
+        """
+        state = cls(
+            last_ts=last_ts,
+            last_close=float(close[-1]),
+            ema_8=float(arrays[0][-1]),
+            ema_21=float(arrays[1][-1]),
+            ema_55=float(arrays[2][-1]),
+        )
+        tails = (
+            (state.close_20, close), (state.close_50, close),
+            (state.returns_21, returns), (state.returns_63, returns),
+            (state.returns_126, returns), (state.volume_21, volume),
+            (state.hist_vol_63, arrays[11]),
+        )
+        for window, values in tails:
+            for x in values[-window.window:]:
+                window.push(float(x))
+
+        # The Wilder numerators are decayed sums over the whole delta history
+        delta = np.diff(close, prepend=close[0])
+        for avg in (state.rsi_14, state.rsi_28):
+            weights = (1.0 - 1.0 / avg.period) ** np.arange(len(delta) - 1, -1, -1)
+            avg.gain_num = float(weights @ np.where(delta > 0, delta, 0.0))
+            avg.loss_num = float(weights @ np.where(delta < 0, -delta, 0.0))
+            avg.weight = float(weights.sum())
+            avg.count = len(delta)
+        return state
+
+    def resume_position(self, index, close) -> Optional[int]:
+        """
+        Position of the first bar not yet folded into this state, or None if
+        the history no longer extends the one the state was built from.
+        """
+        if self.last_ts not in index:
+            return None
+        pos = index.get_loc(self.last_ts)
+        if not isinstance(pos, (int, np.integer)) or close[pos] != self.last_close:
+            return None
+        return pos + 1
+
+    def step(self, ts, close: float, volume: float) -> None:
+        """Fold one new bar into the running state."""
+        # Column scalars may be float32; keep the accumulators in float64
+        close = float(close)
+        volume = float(volume)
+        delta = close - self.last_close
+        ret = close / self.last_close - 1.0
+
+        self.ema_8 = 2.0 / 9.0 * close + (1.0 - 2.0 / 9.0) * self.ema_8
+        self.ema_21 = 2.0 / 22.0 * close + (1.0 - 2.0 / 22.0) * self.ema_21
+        self.ema_55 = 2.0 / 56.0 * close + (1.0 - 2.0 / 56.0) * self.ema_55
+        self.close_20.push(close)
+        self.close_50.push(close)
+        self.returns_21.push(ret)
+        self.returns_63.push(ret)
+        self.returns_126.push(ret)
+        self.volume_21.push(volume)
+        self.hist_vol_63.push(self.returns_21.std() * ANNUALIZATION)
+        self.rsi_14.push(delta)
+        self.rsi_28.push(delta)
+
+        self.last_ts = ts
+        self.last_close = close
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current last-value indicators, keyed like INDICATOR_KEYS."""
+        values = (
+            self.ema_8, self.ema_21, self.ema_55,
+            self.close_20.mean(), self.close_50.mean(),
+            self.close_20.std(), self.close_50.std(),
+            self.returns_21.sum(), self.returns_63.sum(), self.returns_126.sum(),
+            self.volume_21.mean(),
+            self.returns_21.std() * ANNUALIZATION,
+            self.hist_vol_63.mean(), self.hist_vol_63.std(),
+            self.rsi_14.rsi(), self.rsi_28.rsi(),
+        )
+        return dict(zip(INDICATOR_KEYS, values))
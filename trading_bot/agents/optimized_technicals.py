@@ -1,24 +1,124 @@
 import json
-import math
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Dict
+
 import numpy as np
 import pandas as pd
 from langchain_core.messages import HumanMessage
 
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.agents.technicals import (
     BaseAgent,
     AgentState,
     get_prices,
     prices_to_df,
     safe_float,
-    normalize_pandas,
     weighted_signal_combination,
-    calculate_hurst_exponent,
-    calculate_atr,
     calculate_adx,
     show_agent_reasoning
 )
+from src.data.models import Price
 from src.utils.progress import progress
 
+from ..utils.price_cache import PriceCache
+from ._indicators_numba import HAS_NUMBA, compute_all, fast_hurst, last_window_moments, pct_change
+from .indicator_state import INDICATOR_KEYS, IndicatorState
+
+
+# Column arrays for one ticker, extracted once from the price DataFrame
+Bars = namedtuple("Bars", ["close", "high", "low", "volume", "returns"])
+
+@dataclass(slots=True)
+class StrategyReport:
+    """One strategy's section of the reasoning report."""
+    signal: str
+    confidence: int
+    metrics: Dict[str, float]
+
+
+@dataclass(slots=True)
+class SignalReport:
+    """Per-ticker analysis; asdict() gives the published report shape."""
+    signal: str
+    confidence: int
+    reasoning: Dict[str, StrategyReport]
+
+
+def _neutral_report():
+    """Report for a ticker with too little history to evaluate any strategy."""
+    return SignalReport(
+        signal="neutral",
+        confidence=0,
+        reasoning={
+            _REPORT_NAMES[strategy]: StrategyReport("neutral", 50, dict.fromkeys(names, 0.0))
+            for strategy, names in _METRIC_NAMES.items()
+        },
+    )
+
+
+# Minimum history before any signal is computed (shortest rolling window
+# is 20 bars), and before the 63-bar skew/kurt the stat-arb signal needs
+MIN_SIGNAL_BARS = 21
+MIN_STAT_ARB_BARS = 64
+
+# Storage dtype for the extracted price/volume columns. The pure-Python
+# kernel fallback would do float32 scalar arithmetic, so keep float64 there.
+PRICE_DTYPE = np.float32 if HAS_NUMBA else np.float64
+
+# Upper bound on tickers analysed concurrently
+MAX_TICKER_WORKERS = 16
+
+_progress_lock = threading.Lock()
+
+# Ensemble weights per strategy (read-only, shared by every ticker)
+STRATEGY_WEIGHTS = MappingProxyType({
+    "trend": 0.25,
+    "mean_reversion": 0.20,
+    "momentum": 0.25,
+    "volatility": 0.15,
+    "stat_arb": 0.15,
+})
+
+# Metric names emitted by each strategy helper, in tuple order
+_METRIC_NAMES = {
+    "trend": ("adx", "trend_strength"),
+    "mean_reversion": ("z_score", "price_vs_bb", "rsi_14", "rsi_28"),
+    "momentum": ("momentum_1m", "momentum_3m", "momentum_6m", "volume_momentum"),
+    "volatility": ("historical_volatility", "volatility_regime", "volatility_z_score", "atr_ratio"),
+    "stat_arb": ("hurst_exponent", "skewness", "kurtosis"),
+}
+
+# Strategy key -> section name in the reasoning report
+_REPORT_NAMES = {
+    "trend": "trend_following",
+    "mean_reversion": "mean_reversion",
+    "momentum": "momentum",
+    "volatility": "volatility",
+    "stat_arb": "statistical_arbitrage",
+}
+
+
+def _dumps(obj):
+    """Compact JSON string, via orjson when it is installed. Dataclasses are supported."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, default=asdict)
+
+
+def _update_status(ticker, status, **kwargs):
+    """Serialize progress updates coming from worker threads."""
+    with _progress_lock:
+        progress.update_status("technical_analyst_agent", ticker, status, **kwargs)
+
 
 class OptimizedTechnicalAgent(BaseAgent):
     """
@@ -34,6 +134,10 @@ class OptimizedTechnicalAgent(BaseAgent):
     def __init__(self):
         super().__init__()
         self._cache = {}
+        self._price_cache = PriceCache()
+        # Price frames and incremental indicator state per (ticker, start_date)
+        self._df_cache = {}
+        self._indicator_states = {}
     
     def technical_analyst_agent(self, state: AgentState):
         """
@@ -44,97 +148,23 @@ class OptimizedTechnicalAgent(BaseAgent):
         end_date = data["end_date"]
         tickers = data["tickers"]
         
-        # Initialize analysis for each ticker
+        # Tickers are independent: overlap the price fetches (I/O) and the
+        # GIL-free indicator kernels across a small thread pool
         technical_analysis = {}
-        
-        for ticker in tickers:
-            progress.update_status("technical_analyst_agent", ticker, "Analyzing price data")
-            
-            # Get the historical price data
-            prices = get_prices(
-                ticker=ticker,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            
-            if not prices:
-                progress.update_status("technical_analyst_agent", ticker, "Failed: No price data found")
-                continue
-            
-            # Convert prices to a DataFrame
-            prices_df = prices_to_df(prices)
-            
-            # Pre-calculate all needed data at once for better performance
-            progress.update_status("technical_analyst_agent", ticker, "Pre-calculating indicators")
-            indicators = self._pre_calculate_indicators(prices_df)
-            
-            progress.update_status("technical_analyst_agent", ticker, "Calculating signals")
-            
-            # Use pre-calculated indicators for all signal calculations
-            trend_signals = self._calculate_trend_signals_optimized(prices_df, indicators)
-            mean_reversion_signals = self._calculate_mean_reversion_signals_optimized(prices_df, indicators)
-            momentum_signals = self._calculate_momentum_signals_optimized(prices_df, indicators)
-            volatility_signals = self._calculate_volatility_signals_optimized(prices_df, indicators)
-            stat_arb_signals = self._calculate_stat_arb_signals_optimized(prices_df, indicators)
-            
-            # Combine all signals using a weighted ensemble approach
-            strategy_weights = {
-                "trend": 0.25,
-                "mean_reversion": 0.20,
-                "momentum": 0.25,
-                "volatility": 0.15,
-                "stat_arb": 0.15,
-            }
-            
-            progress.update_status("technical_analyst_agent", ticker, "Combining signals")
-            combined_signal = weighted_signal_combination(
-                {
-                    "trend": trend_signals,
-                    "mean_reversion": mean_reversion_signals,
-                    "momentum": momentum_signals,
-                    "volatility": volatility_signals,
-                    "stat_arb": stat_arb_signals,
-                },
-                strategy_weights,
-            )
-            
-            # Generate detailed analysis report for this ticker
-            technical_analysis[ticker] = {
-                "signal": combined_signal["signal"],
-                "confidence": round(combined_signal["confidence"] * 100),
-                "reasoning": {
-                    "trend_following": {
-                        "signal": trend_signals["signal"],
-                        "confidence": round(trend_signals["confidence"] * 100),
-                        "metrics": normalize_pandas(trend_signals["metrics"]),
-                    },
-                    "mean_reversion": {
-                        "signal": mean_reversion_signals["signal"],
-                        "confidence": round(mean_reversion_signals["confidence"] * 100),
-                        "metrics": normalize_pandas(mean_reversion_signals["metrics"]),
-                    },
-                    "momentum": {
-                        "signal": momentum_signals["signal"],
-                        "confidence": round(momentum_signals["confidence"] * 100),
-                        "metrics": normalize_pandas(momentum_signals["metrics"]),
-                    },
-                    "volatility": {
-                        "signal": volatility_signals["signal"],
-                        "confidence": round(volatility_signals["confidence"] * 100),
-                        "metrics": normalize_pandas(volatility_signals["metrics"]),
-                    },
-                    "statistical_arbitrage": {
-                        "signal": stat_arb_signals["signal"],
-                        "confidence": round(stat_arb_signals["confidence"] * 100),
-                        "metrics": normalize_pandas(stat_arb_signals["metrics"]),
-                    },
-                },
-            }
-            progress.update_status("technical_analyst_agent", ticker, "Done", analysis=json.dumps(technical_analysis, indent=4))
+        if tickers:
+            with ThreadPoolExecutor(max_workers=min(MAX_TICKER_WORKERS, len(tickers))) as executor:
+                results = list(executor.map(
+                    lambda ticker: self._analyze_ticker(ticker, start_date, end_date),
+                    tickers,
+                ))
+            # Reports become plain dicts once, after all workers finish
+            for ticker, report in results:
+                if report is not None:
+                    technical_analysis[ticker] = asdict(report)
         
         # Create the technical analyst message
         message = HumanMessage(
-            content=json.dumps(technical_analysis),
+            content=_dumps(technical_analysis),
             name="technical_analyst_agent",
         )
         
@@ -150,90 +180,215 @@ class OptimizedTechnicalAgent(BaseAgent):
             "messages": state["messages"] + [message],
             "data": data,
         }
-    
-    def _pre_calculate_indicators(self, prices_df):
+
+    def _analyze_ticker(self, ticker, start_date, end_date):
         """
-        Pre-calculate all indicators at once to improve performance.
-        This avoids redundant calculations and uses vectorized operations.
+        Run the full technical analysis for one ticker.
+        Returns (ticker, SignalReport) with the report None when no prices are available.
         """
-        indicators = {}
-        
-        # Price data
-        close = prices_df["close"]
-        high = prices_df["high"]
-        low = prices_df["low"]
-        volume = prices_df["volume"]
-        
-        # Returns
-        returns = close.pct_change()
-        indicators["returns"] = returns
+        _update_status(ticker, "Analyzing price data")
         
-        # EMAs - calculate all at once
-        indicators["ema_8"] = close.ewm(span=8, adjust=False).mean()
-        indicators["ema_21"] = close.ewm(span=21, adjust=False).mean()
-        indicators["ema_55"] = close.ewm(span=55, adjust=False).mean()
+        # Get the historical price data
+        prices = self._get_prices_cached(ticker, start_date, end_date)
         
-        # SMAs and standard deviations - calculate all at once
-        indicators["sma_20"] = close.rolling(20).mean()
-        indicators["sma_50"] = close.rolling(50).mean()
-        indicators["std_20"] = close.rolling(20).std()
-        indicators["std_50"] = close.rolling(50).std()
+        if not prices:
+            _update_status(ticker, "Failed: No price data found")
+            return ticker, None
         
-        # Momentum calculations - vectorized
-        indicators["mom_1m"] = returns.rolling(21).sum()
-        indicators["mom_3m"] = returns.rolling(63).sum()
-        indicators["mom_6m"] = returns.rolling(126).sum()
+        # Convert prices to a DataFrame, then pull out the column arrays once
+        prices_df = self._prices_frame(ticker, start_date, prices)
         
-        # Volume calculations
-        indicators["volume_ma_21"] = volume.rolling(21).mean()
+        # Every rolling indicator is still warming up: report neutral
+        if len(prices_df) < MIN_SIGNAL_BARS:
+            report = _neutral_report()
+            _update_status(ticker, "Done", analysis=_dumps(report))
+            return ticker, report
         
-        # Volatility calculations
-        indicators["hist_vol_21"] = returns.rolling(21).std() * math.sqrt(252)
-        indicators["hist_vol_63_ma"] = indicators["hist_vol_21"].rolling(63).mean()
-        indicators["hist_vol_63_std"] = indicators["hist_vol_21"].rolling(63).std()
+        bars = self._extract_bars(prices_df)
         
-        # Statistical calculations
-        indicators["skew_63"] = returns.rolling(63).skew()
-        indicators["kurt_63"] = returns.rolling(63).kurt()
+        # Pre-calculate all needed data at once for better performance
+        _update_status(ticker, "Pre-calculating indicators")
+        indicators = self._pre_calculate_indicators(prices_df, bars, (ticker, start_date))
         
-        # RSI calculations - optimized
-        delta = close.diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        _update_status(ticker, "Calculating signals")
         
-        indicators["rsi_14"] = self._calculate_rsi_optimized(gain, loss, 14)
-        indicators["rsi_28"] = self._calculate_rsi_optimized(gain, loss, 28)
+        # Evaluate every strategy in a single pass over the indicators
+        signals = self._compute_all_signals(bars, indicators)
         
-        # ADX calculation
-        indicators["adx_data"] = calculate_adx(prices_df, 14)
-        
-        # ATR calculation
-        indicators["atr"] = calculate_atr(prices_df, 14)
+        # Combine all signals using a weighted ensemble approach
+        _update_status(ticker, "Combining signals")
+        combined_signal = weighted_signal_combination(signals, STRATEGY_WEIGHTS)
         
+        # Generate detailed analysis report for this ticker
+        report = SignalReport(
+            signal=combined_signal["signal"],
+            confidence=round(combined_signal["confidence"] * 100),
+            reasoning={
+                _REPORT_NAMES[strategy]: StrategyReport(
+                    result["signal"], round(result["confidence"] * 100), result["metrics"]
+                )
+                for strategy, result in signals.items()
+            },
+        )
+        _update_status(ticker, "Done", analysis=_dumps(report))
+        return ticker, report
+
+    def _get_prices_cached(self, ticker, start_date, end_date):
+        """Fetch prices, reusing the on-disk copy for fully elapsed windows."""
+        records = self._price_cache.get(ticker, start_date, end_date)
+        if records is not None:
+            return [Price(**record) for record in records]
+
+        prices = get_prices(
+            ticker=ticker,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if prices:
+            self._price_cache.set(ticker, start_date, end_date, [p.model_dump() for p in prices])
+        return prices
+
+    def _prices_frame(self, ticker, start_date, prices):
+        """
+        prices_to_df() that reuses the previous frame for this window. When the
+        cached frame is still a prefix of ``prices`` only the new rows are
+        converted and appended; otherwise the frame is rebuilt.
+        """
+        key = (ticker, start_date)
+        cached = self._df_cache.get(key)
+        if cached is not None and len(prices) >= len(cached):
+            anchor = prices[len(cached) - 1]
+            if pd.Timestamp(anchor.time) == cached.index[-1] and anchor.close == cached["close"].iloc[-1]:
+                if len(prices) == len(cached):
+                    return cached
+                prices_df = pd.concat([cached, prices_to_df(prices[len(cached):])])
+                self._df_cache[key] = prices_df
+                return prices_df
+
+        prices_df = prices_to_df(prices)
+        self._df_cache[key] = prices_df
+        return prices_df
+
+    def _extract_bars(self, prices_df):
+        """
+        Convert the price DataFrame into contiguous column arrays.
+        Prices are stored as float32 to halve memory traffic through the
+        kernels; returns and all kernel accumulators stay float64.
+        """
+        close = prices_df["close"].to_numpy(dtype=PRICE_DTYPE)
+        return Bars(
+            close=close,
+            high=prices_df["high"].to_numpy(dtype=PRICE_DTYPE),
+            low=prices_df["low"].to_numpy(dtype=PRICE_DTYPE),
+            volume=prices_df["volume"].to_numpy(dtype=PRICE_DTYPE),
+            returns=pct_change(close),
+        )
+    
+    def _pre_calculate_indicators(self, prices_df, bars, state_key=None):
+        """
+        Pre-calculate all indicators at once to improve performance.
+        The rolling/ewm set comes from a single compiled pass over the raw
+        column arrays, or from the incremental state kept under
+        ``state_key`` when the history only gained bars since the last call.
+        Signal functions only read the latest bar, so only last-value
+        scalars are kept. ``prices_df`` is only handed to the upstream
+        DataFrame-based ADX helper.
+        """
+        indicators = self._rolling_indicators(prices_df, bars, state_key)
+        skew_63, kurt_63 = last_window_moments(bars.returns, 63)
+        
+        indicators.update({
+            "skew_63_last": skew_63,
+            "kurt_63_last": kurt_63,
+            "adx_last": calculate_adx(prices_df, 14)["adx"].iloc[-1],
+            "atr_last": self._atr_last(bars, 14),
+            # Stat-arb can't fire without a 63-bar skew, so skip Hurst until then
+            "hurst": fast_hurst(bars.close) if len(bars.close) >= MIN_STAT_ARB_BARS else np.nan,
+        })
         return indicators
     
-    def _calculate_rsi_optimized(self, gain, loss, period):
-        """Optimized RSI calculation using exponential moving average."""
-        avg_gain = gain.ewm(com=period-1, adjust=True, min_periods=period).mean()
-        avg_loss = loss.ewm(com=period-1, adjust=True, min_periods=period).mean()
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+    @staticmethod
+    def _atr_last(bars, period):
+        """
+        Last value of calculate_atr(): the mean true range over the final
+        ``period`` bars, computed on the column arrays instead of a pandas
+        rolling window over the whole frame.
+        """
+        n = len(bars.close)
+        if n < period:
+            return np.nan
+        start = n - period
+        high = bars.high[start:].astype(np.float64)
+        low = bars.low[start:].astype(np.float64)
+        # The first bar has no previous close; fmax skips NaN like DataFrame.max
+        prev_close = np.empty(period)
+        prev_close[0] = bars.close[start - 1] if start > 0 else np.nan
+        prev_close[1:] = bars.close[start:n - 1]
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+        return true_range.mean()
+    
+    def _rolling_indicators(self, prices_df, bars, state_key):
+        """Advance the cached IndicatorState, falling back to a bulk pass."""
+        state = self._indicator_states.get(state_key) if state_key is not None else None
+        start = state.resume_position(prices_df.index, bars.close) if state is not None else None
+        
+        if start is None:
+            arrays = compute_all(bars.close, bars.volume, bars.returns)
+            if state_key is not None:
+                self._indicator_states[state_key] = IndicatorState.from_history(
+                    prices_df.index[-1], bars.close, bars.volume, bars.returns, arrays
+                )
+            return dict(zip(INDICATOR_KEYS, (values[-1] for values in arrays)))
+        
+        for i in range(start, len(bars.close)):
+            state.step(prices_df.index[i], bars.close[i], bars.volume[i])
+        return state.snapshot()
     
-    def _calculate_trend_signals_optimized(self, prices_df, indicators):
-        """Optimized trend following strategy using pre-calculated indicators."""
-        # Use pre-calculated EMAs
-        ema_8 = indicators["ema_8"]
-        ema_21 = indicators["ema_21"]
-        ema_55 = indicators["ema_55"]
-        
-        # Use pre-calculated ADX
-        adx = indicators["adx_data"]["adx"].iloc[-1]
+    def _compute_all_signals(self, bars, indicators):
+        """
+        Evaluate the five strategies in one pass over the pre-calculated
+        indicators. Each scalar is read once and handed to the strategy
+        helpers, which return (signal, confidence, metrics); the result
+        dicts are only built at the end.
+        """
+        close = bars.close[-1]
+        results = {
+            "trend": self._trend_signal(
+                indicators["ema_8_last"], indicators["ema_21_last"],
+                indicators["ema_55_last"], indicators["adx_last"],
+            ),
+            "mean_reversion": self._mean_reversion_signal(
+                close, indicators["sma_20_last"], indicators["std_20_last"],
+                indicators["sma_50_last"], indicators["std_50_last"],
+                indicators["rsi_14_last"], indicators["rsi_28_last"],
+            ),
+            "momentum": self._momentum_signal(
+                indicators["mom_1m_last"], indicators["mom_3m_last"], indicators["mom_6m_last"],
+                bars.volume[-1], indicators["volume_ma_21_last"],
+            ),
+            "volatility": self._volatility_signal(
+                close, indicators["hist_vol_21_last"], indicators["hist_vol_63_ma_last"],
+                indicators["hist_vol_63_std_last"], indicators["atr_last"],
+            ),
+            "stat_arb": self._stat_arb_signal(
+                indicators["hurst"], indicators["skew_63_last"], indicators["kurt_63_last"],
+            ),
+        }
         
-        # Determine trend direction and strength
-        short_trend = ema_8.iloc[-1] > ema_21.iloc[-1]
-        medium_trend = ema_21.iloc[-1] > ema_55.iloc[-1]
+        return {
+            strategy: {
+                "signal": signal,
+                "confidence": confidence,
+                "metrics": {name: safe_float(value) for name, value in zip(_METRIC_NAMES[strategy], metrics)},
+            }
+            for strategy, (signal, confidence, metrics) in results.items()
+        }
+    
+    @staticmethod
+    def _trend_signal(ema_8, ema_21, ema_55, adx):
+        """Trend following: EMA alignment weighted by ADX strength."""
+        short_trend = ema_8 > ema_21
+        medium_trend = ema_21 > ema_55
         
         # Combine signals with confidence weighting
         trend_strength = adx / 100.0
@@ -248,75 +403,38 @@ class OptimizedTechnicalAgent(BaseAgent):
             signal = "neutral"
             confidence = 0.5
         
-        return {
-            "signal": signal,
-            "confidence": confidence,
-            "metrics": {
-                "adx": safe_float(adx),
-                "trend_strength": safe_float(trend_strength),
-            },
-        }
+        return signal, confidence, (adx, trend_strength)
     
-    def _calculate_mean_reversion_signals_optimized(self, prices_df, indicators):
-        """Optimized mean reversion strategy using pre-calculated indicators."""
-        close = prices_df["close"]
-        
-        # Use pre-calculated values
-        ma_50 = indicators["sma_50"]
-        std_50 = indicators["std_50"]
-        
-        # Z-score calculation
-        z_score = (close - ma_50) / std_50
+    @staticmethod
+    def _mean_reversion_signal(close, sma_20, std_20, sma_50, std_50, rsi_14, rsi_28):
+        """Mean reversion: 50-bar z-score confirmed by Bollinger Band position."""
+        z_score = (close - sma_50) / std_50
         
         # Bollinger Bands using pre-calculated values
-        sma_20 = indicators["sma_20"]
-        std_20 = indicators["std_20"]
         bb_upper = sma_20 + (std_20 * 2)
         bb_lower = sma_20 - (std_20 * 2)
-        
-        # Use pre-calculated RSI
-        rsi_14 = indicators["rsi_14"]
-        rsi_28 = indicators["rsi_28"]
-        
-        # Mean reversion signals
-        price_vs_bb = (close.iloc[-1] - bb_lower.iloc[-1]) / (bb_upper.iloc[-1] - bb_lower.iloc[-1])
+        price_vs_bb = (close - bb_lower) / (bb_upper - bb_lower)
         
         # Combine signals
-        if z_score.iloc[-1] < -2 and price_vs_bb < 0.2:
+        if z_score < -2 and price_vs_bb < 0.2:
             signal = "bullish"
-            confidence = min(abs(z_score.iloc[-1]) / 4, 1.0)
-        elif z_score.iloc[-1] > 2 and price_vs_bb > 0.8:
+            confidence = min(abs(z_score) / 4, 1.0)
+        elif z_score > 2 and price_vs_bb > 0.8:
             signal = "bearish"
-            confidence = min(abs(z_score.iloc[-1]) / 4, 1.0)
+            confidence = min(abs(z_score) / 4, 1.0)
         else:
             signal = "neutral"
             confidence = 0.5
         
-        return {
-            "signal": signal,
-            "confidence": confidence,
-            "metrics": {
-                "z_score": safe_float(z_score.iloc[-1]),
-                "price_vs_bb": safe_float(price_vs_bb),
-                "rsi_14": safe_float(rsi_14.iloc[-1]),
-                "rsi_28": safe_float(rsi_28.iloc[-1]),
-            },
-        }
+        return signal, confidence, (z_score, price_vs_bb, rsi_14, rsi_28)
     
-    def _calculate_momentum_signals_optimized(self, prices_df, indicators):
-        """Optimized momentum strategy using pre-calculated indicators."""
-        # Use pre-calculated momentum values
-        mom_1m = indicators["mom_1m"]
-        mom_3m = indicators["mom_3m"]
-        mom_6m = indicators["mom_6m"]
-        
-        # Volume momentum
-        volume = prices_df["volume"]
-        volume_ma = indicators["volume_ma_21"]
-        volume_momentum = volume.iloc[-1] / volume_ma.iloc[-1] if volume_ma.iloc[-1] > 0 else 1.0
+    @staticmethod
+    def _momentum_signal(mom_1m, mom_3m, mom_6m, volume, volume_ma):
+        """Momentum: weighted 1/3/6-month returns confirmed by volume."""
+        volume_momentum = volume / volume_ma if volume_ma > 0 else 1.0
         
         # Calculate momentum score
-        momentum_score = (0.4 * mom_1m.iloc[-1] + 0.3 * mom_3m.iloc[-1] + 0.3 * mom_6m.iloc[-1])
+        momentum_score = (0.4 * mom_1m + 0.3 * mom_3m + 0.3 * mom_6m)
         
         # Volume confirmation
         volume_confirmation = volume_momentum > 1.0
@@ -331,34 +449,18 @@ class OptimizedTechnicalAgent(BaseAgent):
             signal = "neutral"
             confidence = 0.5
         
-        return {
-            "signal": signal,
-            "confidence": confidence,
-            "metrics": {
-                "momentum_1m": safe_float(mom_1m.iloc[-1]),
-                "momentum_3m": safe_float(mom_3m.iloc[-1]),
-                "momentum_6m": safe_float(mom_6m.iloc[-1]),
-                "volume_momentum": safe_float(volume_momentum),
-            },
-        }
+        return signal, confidence, (mom_1m, mom_3m, mom_6m, volume_momentum)
     
-    def _calculate_volatility_signals_optimized(self, prices_df, indicators):
-        """Optimized volatility-based trading strategy using pre-calculated indicators."""
-        # Use pre-calculated volatility metrics
-        hist_vol = indicators["hist_vol_21"]
-        vol_ma = indicators["hist_vol_63_ma"]
-        vol_std = indicators["hist_vol_63_std"]
-        
-        # Volatility regime detection
-        vol_regime = hist_vol.iloc[-1] / vol_ma.iloc[-1] if vol_ma.iloc[-1] > 0 else 1.0
+    @staticmethod
+    def _volatility_signal(close, hist_vol, vol_ma, vol_std, atr):
+        """Volatility regime: current vs 63-bar average historical volatility."""
+        vol_regime = hist_vol / vol_ma if vol_ma > 0 else 1.0
         
         # Volatility z-score
-        vol_z_score = ((hist_vol.iloc[-1] - vol_ma.iloc[-1]) / vol_std.iloc[-1] 
-                       if vol_std.iloc[-1] > 0 else 0.0)
+        vol_z_score = (hist_vol - vol_ma) / vol_std if vol_std > 0 else 0.0
         
         # ATR ratio
-        atr = indicators["atr"]
-        atr_ratio = atr.iloc[-1] / prices_df["close"].iloc[-1] if prices_df["close"].iloc[-1] > 0 else 0.0
+        atr_ratio = atr / close if close > 0 else 0.0
         
         # Generate signal based on volatility regime
         if vol_regime < 0.8 and vol_z_score < -1:
@@ -371,43 +473,19 @@ class OptimizedTechnicalAgent(BaseAgent):
             signal = "neutral"
             confidence = 0.5
         
-        return {
-            "signal": signal,
-            "confidence": confidence,
-            "metrics": {
-                "historical_volatility": safe_float(hist_vol.iloc[-1]),
-                "volatility_regime": safe_float(vol_regime),
-                "volatility_z_score": safe_float(vol_z_score),
-                "atr_ratio": safe_float(atr_ratio),
-            },
-        }
+        return signal, confidence, (hist_vol, vol_regime, vol_z_score, atr_ratio)
     
-    def _calculate_stat_arb_signals_optimized(self, prices_df, indicators):
-        """Optimized statistical arbitrage signals using pre-calculated indicators."""
-        # Use pre-calculated statistics
-        skew = indicators["skew_63"]
-        kurt = indicators["kurt_63"]
-        
-        # Calculate Hurst exponent (this is still expensive, but necessary)
-        hurst = calculate_hurst_exponent(prices_df["close"])
-        
-        # Generate signal based on statistical properties
-        if hurst < 0.4 and skew.iloc[-1] > 1:
+    @staticmethod
+    def _stat_arb_signal(hurst, skew, kurt):
+        """Statistical arbitrage: mean-reverting (low Hurst) series with skewed returns."""
+        if hurst < 0.4 and skew > 1:
             signal = "bullish"
             confidence = (0.5 - hurst) * 2
-        elif hurst < 0.4 and skew.iloc[-1] < -1:
+        elif hurst < 0.4 and skew < -1:
             signal = "bearish"
             confidence = (0.5 - hurst) * 2
         else:
             signal = "neutral"
             confidence = 0.5
         
-        return {
-            "signal": signal,
-            "confidence": confidence,
-            "metrics": {
-                "hurst_exponent": safe_float(hurst),
-                "skewness": safe_float(skew.iloc[-1]),
-                "kurtosis": safe_float(kurt.iloc[-1]),
-            },
-        }
\ No newline at end of file
+        return signal, confidence, (hurst, skew, kurt)
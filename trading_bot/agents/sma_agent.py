@@ -3,20 +3,141 @@ Simple Moving Average (SMA) Trading Agent
 High-performance implementation with optimized calculations.
 """
 
-import asyncio
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-import logging
+import math
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Tuple, Union
+import warnings
 
-# Try to import pandas/numpy for optimized performance
+# Try to import numpy for optimized performance
 try:
     import numpy as np
-    import pandas as pd
-    HAS_PANDAS = True
+    HAS_NUMPY = True
 except ImportError:
-    HAS_PANDAS = False
+    HAS_NUMPY = False
 
-from trading_bot.base_agent import BaseAgent
+# Compiled crossover kernel (needs numpy; fast only when numba is installed)
+try:
+    from trading_bot.agents import _sma_kernels
+    HAS_NUMBA = _sma_kernels.HAS_NUMBA
+except ImportError:
+    _sma_kernels = None
+    HAS_NUMBA = False
+
+from trading_bot.base_agent import BaseAgent, MarketSnapshot
+
+
+def _fast_sma(arr: "np.ndarray", w: int) -> "np.ndarray":
+    """
+    Full-length SMA via a cumulative-sum difference, O(n) regardless of w.
+    Equivalent to Series.rolling(w).mean() (NaN for the first w-1 values).
+    """
+    out = np.full(len(arr), np.nan)
+    if w <= 0 or len(arr) < w:
+        return out
+    cs = np.cumsum(arr, dtype=np.float64)
+    out[w - 1] = cs[w - 1] / w
+    out[w:] = (cs[w:] - cs[:-w]) / w
+    return out
+
+
+# Bound on cached (symbol, last bar) SMA results, evicted least recently used first
+SMA_CACHE_SIZE = 1024
+
+
+def _to_datetime64(values: list) -> "np.ndarray":
+    """Parse timestamps to datetime64[ns]; tz-aware values are converted to UTC."""
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='no explicit representation of timezones')
+        return np.array(values, dtype='datetime64[ns]')
+
+
+def _fast_sma_2d(matrix: "np.ndarray", w: int) -> "np.ndarray":
+    """Row-wise _fast_sma over an (n_symbols, n_bars) array."""
+    out = np.full(matrix.shape, np.nan)
+    if w <= 0 or matrix.shape[1] < w:
+        return out
+    cs = np.cumsum(matrix, axis=1, dtype=np.float64)
+    out[:, w - 1] = cs[:, w - 1] / w
+    out[:, w:] = (cs[:, w:] - cs[:, :-w]) / w
+    return out
+
+
+@dataclass(slots=True, frozen=True)
+class Signal:
+    """
+    A crossover signal. Kept as plain fields until to_dict() builds the
+    engine-facing dict (reasoning text and metadata included).
+    """
+    symbol: str
+    action: str
+    quantity: float
+    confidence: float
+    fast: float
+    slow: float
+    price: float
+    
+    @property
+    def reasoning(self) -> str:
+        direction = 'above' if self.action == 'buy' else 'below'
+        return f'Fast SMA ({self.fast:.2f}) crossed {direction} Slow SMA ({self.slow:.2f})'
+    
+    def to_dict(self) -> dict:
+        return {
+            'symbol': self.symbol,
+            'action': self.action,
+            'quantity': self.quantity,
+            'confidence': self.confidence,
+            'reasoning': self.reasoning,
+            'metadata': {
+                'fast_sma': self.fast,
+                'slow_sma': self.slow,
+                'current_price': self.price,
+                'strategy': 'sma_crossover'
+            }
+        }
+
+
+class ColdHistory(NamedTuple):
+    """Parsed history for a symbol that needs a full SMA recompute."""
+    historical: Sequence
+    close: Any
+    ts: Any
+    last_close: float
+
+
+@dataclass
+class SMAState:
+    """
+    Running-sum SMA state for one symbol, advanced one bar at a time.
+    
+    The last max(fast, slow) closes live in a contiguous float32 ring buffer
+    (4 bytes per bar); ``head`` is the next slot to write and ``count`` the
+    number of valid slots. The running sums are float64 over the stored
+    float32 values, so adding and removing a close cancels exactly.
+    """
+    closes: array
+    head: int
+    count: int
+    sum_fast: float
+    sum_slow: float
+    current_fast: float
+    current_slow: float
+    prev_fast: float
+    prev_slow: float
+    last_n: int
+    last_ts: Any
+    last_close: float
+    pushes: int = 0
+    
+    def tail(self, k: int) -> List[float]:
+        """The last k closes (k <= count), oldest first."""
+        cap = len(self.closes)
+        start = (self.head - k) % cap
+        if start + k <= cap:
+            return self.closes[start:start + k].tolist()
+        return self.closes[start:].tolist() + self.closes[:start + k - cap].tolist()
 
 
 class SMAAgent(BaseAgent):
@@ -26,9 +147,12 @@ class SMAAgent(BaseAgent):
     Strategy:
     - Buy when fast SMA crosses above slow SMA
     - Sell when fast SMA crosses below slow SMA
-    - Uses optimized pandas operations for performance
+    - Uses vectorized numpy operations for performance
     """
     
+    __slots__ = ('fast_period', 'slow_period', 'min_data_points', 'position_size_pct',
+                 '_sma_cache', '_sma_state', '_last_signals')
+    
     def __init__(self, 
                  fast_period: int = 10, 
                  slow_period: int = 20,
@@ -51,20 +175,20 @@ class SMAAgent(BaseAgent):
         self.position_size_pct = position_size_pct
         
         # Performance optimization: cache calculations
-        self._price_cache = {}
-        self._sma_cache = {}
+        self._sma_cache: OrderedDict = OrderedDict()
+        self._sma_state: Dict[str, SMAState] = {}
         self._last_signals = {}
         
-        # Logging
-        self.logger = logging.getLogger(f"trading_bot.{self.name}")
-        
-    async def generate_signals(self, snapshot: dict) -> List[dict]:
+    async def generate_signals(self, snapshot: Union[dict, MarketSnapshot]) -> List[dict]:
         """
         Generate SMA crossover signals with heartbeat integration.
         
+        ``snapshot`` may be the engine's dict or a MarketSnapshot whose
+        aligned sequences avoid per-symbol dict lookups.
+        
         Performance optimizations:
         1. Cache price data and SMA calculations
-        2. Use vectorized pandas operations
+        2. Use vectorized numpy operations
         3. Only recalculate when new data arrives
         4. Early exit for insufficient data
         """
@@ -81,17 +205,53 @@ class SMAAgent(BaseAgent):
             # Record heartbeat at start of execution
             await heartbeat(self.name, "healthy", metadata={"phase": "start_signal_generation"})
 
-            prices_data = snapshot.get('prices', {})
-            current_positions = snapshot.get('positions', {})
+            # Work on aligned symbol/price/position sequences
+            if not isinstance(snapshot, MarketSnapshot):
+                snapshot = MarketSnapshot.from_dict(snapshot)
+            symbols, prices, positions = snapshot.symbols, snapshot.prices, snapshot.positions
             
-            for symbol, price_data in prices_data.items():
+            # First pass: reuse signals for symbols whose history hasn't moved,
+            # advance the rest, deferring full recomputes
+            smas = [None] * len(symbols)
+            reused = {}
+            failed = {}
+            for i, (symbol, price_data, position) in enumerate(zip(symbols, prices, positions)):
                 try:
-                    signal = await self._generate_signal_for_symbol(
-                        symbol, price_data, current_positions.get(symbol, 0)
-                    )
+                    hit, signal = self._reuse_signal(symbol, price_data, position)
+                    if hit:
+                        reused[i] = signal
+                    else:
+                        smas[i] = self._prepare_symbol(symbol, price_data)
+                except Exception as symbol_error:
+                    failed[i] = symbol_error
+            
+            # Recompute every cold symbol in one batch
+            cold = {symbols[i]: sma for i, sma in enumerate(smas) if isinstance(sma, ColdHistory)}
+            if cold:
+                recomputed = self._full_sma_batch(cold)
+                smas = [recomputed[symbols[i]] if isinstance(sma, ColdHistory) else sma
+                        for i, sma in enumerate(smas)]
+            
+            # Flag crossovers (and their confidence) for all prepared symbols
+            # at once; only flagged symbols go on to build a signal
+            flagged = self._crossover_candidates(smas, positions)
+
+            for i, symbol in enumerate(symbols):
+                try:
+                    if i in failed:
+                        raise failed[i]
+                    if i in reused:
+                        signal = reused[i]
+                    else:
+                        if flagged is None:
+                            signal = self._signal_from_sma(symbol, prices[i], smas[i], positions[i])
+                        elif i in flagged:
+                            signal = self._signal_from_sma(symbol, prices[i], smas[i], positions[i], flagged[i])
+                        else:
+                            signal = self._signal_from_sma(symbol, prices[i], None, positions[i])
 
                     if signal:
-                        signals.append(signal)
+                        signals.append(signal.to_dict())
 
                 except Exception as symbol_error:
                     # Log symbol-specific errors but continue with other symbols
@@ -107,7 +267,7 @@ class SMAAgent(BaseAgent):
                           metadata={
                               "phase": "completed_signal_generation",
                               "signals_generated": len(signals),
-                              "symbols_processed": len(prices_data)
+                              "symbols_processed": len(symbols)
                           })
                     
         except Exception as e:
@@ -126,87 +286,351 @@ class SMAAgent(BaseAgent):
     
     async def _generate_signal_for_symbol(self, symbol: str, price_data: dict, current_position: float) -> dict:
         """Generate signal for a single symbol with performance optimizations."""
+        hit, signal = self._reuse_signal(symbol, price_data, current_position)
+        if not hit:
+            sma = self._prepare_symbol(symbol, price_data)
+            if isinstance(sma, ColdHistory):
+                sma = self._full_sma_batch({symbol: sma})[symbol]
+            signal = self._signal_from_sma(symbol, price_data, sma, current_position)
+        return signal.to_dict() if signal else None
+    
+    def _signal_from_sma(self, symbol: str, price_data: dict,
+                         sma: Optional[Tuple[float, float, float, float, float]],
+                         current_position: float, confidence: Optional[float] = None) -> Optional["Signal"]:
+        """Detect a crossover from prepared SMAs and remember the outcome for reuse."""
+        signal = None
+        if sma is not None:
+            # Detect crossovers
+            current_fast, current_slow, prev_fast, prev_slow, current_price = sma
+            signal = self._detect_crossover(
+                current_fast, current_slow, prev_fast, prev_slow, 
+                current_position, symbol, current_price, confidence
+            )
         
+        bar_key = self._bar_key(price_data)
+        if bar_key is not None:
+            self._last_signals[symbol] = (bar_key, current_position, signal)
+        return signal
+    
+    def _crossover_candidates(self, smas: List[Any], positions: Sequence[float]) -> Optional[Dict[int, float]]:
+        """
+        Indices of symbols whose SMAs and position would produce a buy or sell
+        in _detect_crossover, mapped to that signal's confidence, evaluated as
+        boolean masks over the whole snapshot. Returns None without numpy,
+        meaning every symbol must be checked.
+        """
+        if not HAS_NUMPY:
+            return None
+        rows = [i for i, sma in enumerate(smas) if sma is not None]
+        if not rows:
+            return {}
+        
+        values = np.array([smas[i][:4] for i in rows], dtype=np.float64)
+        position = np.asarray(positions, dtype=np.float64)[rows]
+        current_fast, current_slow, prev_fast, prev_slow = values.T
+        bullish = (prev_fast <= prev_slow) & (current_fast > current_slow) & (position <= 0)
+        bearish = (prev_fast >= prev_slow) & (current_fast < current_slow) & (position > 0)
+        hits = np.flatnonzero(bullish | bearish)
+        confidence = self._calculate_confidence_vec(current_fast[hits], current_slow[hits])
+        return {rows[i]: c for i, c in zip(hits.tolist(), confidence.tolist())}
+    
+    def _reuse_signal(self, symbol: str, price_data: dict, current_position: float) -> Tuple[bool, Optional["Signal"]]:
+        """
+        Staleness check: if neither the symbol's latest bar nor its position
+        changed since the last call, the previous outcome still holds.
+        
+        Returns:
+            (hit, signal) where signal is the previous result on a hit
+        """
+        cached = self._last_signals.get(symbol)
+        if cached is None:
+            return False, None
+        bar_key, position, signal = cached
+        if position != current_position or bar_key != self._bar_key(price_data):
+            return False, None
+        return True, signal
+    
+    @staticmethod
+    def _bar_key(price_data: dict) -> Optional[tuple]:
+        """(length, last timestamp, last close) of a symbol's history, or None if it has none."""
+        historical = price_data.get('historical')
+        if historical is None or len(historical) == 0:
+            return None
+        last_bar = historical[-1]
+        return len(historical), last_bar['timestamp'], last_bar['close']
+    
+    def _prepare_symbol(self, symbol: str, price_data: dict):
+        """
+        Advance a symbol's SMAs as far as possible without a full recompute.
+        
+        Returns:
+            None if there is not enough history, a (current_fast, current_slow,
+            prev_fast, prev_slow, current_price) tuple, or a ColdHistory to be
+            passed to _full_sma_batch
+        """
         # Extract price series
         if 'historical' not in price_data or len(price_data['historical']) < self.min_data_points:
             return None
-            
-        # Convert to appropriate data structure
-        data = self._create_price_dataframe(price_data['historical'])
         
-        if HAS_PANDAS and hasattr(data, 'iloc'):
-            # Pandas path
-            if len(data) < max(self.fast_period, self.slow_period):
+        historical = price_data['historical']
+        if len(historical) < max(self.fast_period, self.slow_period):
+            return None
+        
+        # New bars appended to the previous history only need an O(1) update
+        state = self._sma_state.get(symbol)
+        new_bars = self._appended_bars(state, historical) if state is not None else None
+        if new_bars is not None:
+            for bar in new_bars:
+                self._push_close(state, float(bar['close']))
+            state.last_n = len(historical)
+            state.last_ts = historical[-1]['timestamp']
+            state.last_close = float(historical[-1]['close'])
+            return (state.current_fast, state.current_slow,
+                    state.prev_fast, state.prev_slow, state.last_close)
+        
+        close, ts, last_close = self._parse_price_history(historical)
+        if not HAS_NUMPY:
+            # Calculate SMAs using simple method
+            current_fast, current_slow, prev_fast, prev_slow = self._simple_sma_pair(
+                close, self.fast_period, self.slow_period
+            )
+            if current_fast is None or current_slow is None:
                 return None
-                
-            cache_key = f"{symbol}_{len(data)}_{data['close'].iloc[-1]}"
-            if cache_key in self._sma_cache:
-                fast_sma, slow_sma = self._sma_cache[cache_key]
+            return self._finish_cold(symbol, historical, close, last_close,
+                                     (current_fast, current_slow, prev_fast, prev_slow))
+        
+        return ColdHistory(historical, close, ts, last_close)
+    
+    def _full_sma_batch(self, cold: Dict[str, ColdHistory]) -> Dict[str, Tuple[float, float, float, float, float]]:
+        """
+        Cold-start path: compute (current_fast, current_slow, prev_fast,
+        prev_slow, current_price) for each symbol over its whole history and
+        reseed its running-sum state.
+        
+        Only the last max(fast, slow) + 1 closes matter, so the uncached
+        symbols' tails are stacked right-aligned into one matrix. With numba
+        a parallel kernel handles the rows across threads; otherwise both
+        SMAs come from a single row-wise cumsum, with the padding masked so
+        missing windows come out NaN. The numba kernel is compiled with the
+        periods as constants, once per (fast, slow) pair.
+        """
+        fast, slow = self.fast_period, self.slow_period
+        values = {}
+        uncached = []
+        for symbol, hist in cold.items():
+            # Keyed by the last bar's time; the stored close guards against revisions
+            cache_key = (symbol, int(hist.ts[-1].view('i8')))
+            cached = self._sma_cache.get(cache_key)
+            if cached is not None and cached[0] == hist.last_close:
+                self._sma_cache.move_to_end(cache_key)
+                values[symbol] = cached[1:]
             else:
-                fast_sma = data['close'].rolling(window=self.fast_period, min_periods=self.fast_period).mean()
-                slow_sma = data['close'].rolling(window=self.slow_period, min_periods=self.slow_period).mean()
-                self._sma_cache[cache_key] = (fast_sma, slow_sma)
-                
-            current_fast = fast_sma.iloc[-1]
-            current_slow = slow_sma.iloc[-1]
-            prev_fast = fast_sma.iloc[-2] if len(fast_sma) > 1 else current_fast
-            prev_slow = slow_sma.iloc[-2] if len(slow_sma) > 1 else current_slow
-            current_price = data['close'].iloc[-1]
+                uncached.append((symbol, cache_key))
+        
+        if uncached:
+            width = max(fast, slow) + 1
+            matrix = np.zeros((len(uncached), width))
+            lengths = np.empty(len(uncached), dtype=np.int64)
+            for row, (symbol, _) in enumerate(uncached):
+                tail = cold[symbol].close[-width:]
+                matrix[row, width - len(tail):] = tail
+                lengths[row] = len(tail)
+            
+            if HAS_NUMBA:
+                batch = _sma_kernels.batch_crossover(matrix, lengths, fast, slow)
+            else:
+                columns = np.arange(width)
+                first_valid = width - lengths
+                smas = []
+                for period in (fast, slow):
+                    sma = _fast_sma_2d(matrix, period)
+                    sma[columns[None, :] - period + 1 < first_valid[:, None]] = np.nan
+                    smas.append(sma)
+                fast_sma, slow_sma = smas
+                batch = np.column_stack((fast_sma[:, -1], slow_sma[:, -1], fast_sma[:, -2], slow_sma[:, -2]))
+            
+            for row, (symbol, cache_key) in enumerate(uncached):
+                values[symbol] = tuple(batch[row].tolist())
+                self._cache_sma(cache_key, cold[symbol].last_close, values[symbol])
+        
+        return {
+            symbol: self._finish_cold(symbol, hist.historical, hist.close, hist.last_close, values[symbol])
+            for symbol, hist in cold.items()
+        }
+    
+    def _cache_sma(self, cache_key: Tuple[str, int], last_close: float, values: Tuple[float, ...]) -> None:
+        """Store cold-start SMA values, evicting the least recently used entry."""
+        self._sma_cache[cache_key] = (last_close, *values)
+        if len(self._sma_cache) > SMA_CACHE_SIZE:
+            self._sma_cache.popitem(last=False)
+    
+    def _finish_cold(self, symbol: str, historical: Sequence, close: Sequence[float], last_close: float,
+                     values: Tuple[float, float, float, float]) -> Tuple[float, float, float, float, float]:
+        """Reseed the symbol's running-sum state after a full recompute."""
+        # Only a chronologically ordered history can be extended bar by bar
+        last_bar = historical[-1]
+        if float(last_bar['close']) == last_close:
+            self._sma_state[symbol] = self._seed_state(close, historical)
         else:
-            # Simple list path
-            if len(data) < max(self.fast_period, self.slow_period):
+            self._sma_state.pop(symbol, None)
+        
+        return (*values, last_close)
+    
+    def _seed_state(self, closes: Sequence[float], historical: Sequence) -> SMAState:
+        """Build running-sum state from the ordered closes of a full history."""
+        fast, slow = self.fast_period, self.slow_period
+        n = len(closes)
+        
+        def window_mean(end: int, period: int) -> float:
+            if end < period:
+                return math.nan
+            return math.fsum(closes[end - period:end]) / period
+        
+        cap = max(fast, slow)
+        tail = [float(x) for x in closes[-cap:]]
+        buf = array('f', tail + [0.0] * (cap - len(tail)))
+        # Sum what the buffer holds so later removals cancel exactly
+        stored = buf[:len(tail)].tolist()
+        return SMAState(
+            closes=buf,
+            head=len(tail) % cap,
+            count=len(tail),
+            sum_fast=math.fsum(stored[-fast:]),
+            sum_slow=math.fsum(stored[-slow:]),
+            current_fast=window_mean(n, fast),
+            current_slow=window_mean(n, slow),
+            prev_fast=window_mean(n - 1, fast),
+            prev_slow=window_mean(n - 1, slow),
+            last_n=n,
+            last_ts=historical[-1]['timestamp'],
+            last_close=float(historical[-1]['close']),
+        )
+    
+    def _appended_bars(self, state: SMAState, historical: Sequence) -> Optional[Sequence]:
+        """
+        Bars added since ``state`` was last updated, or None if ``historical``
+        does not contain the last folded bar followed by newer bars (reset,
+        revision, reordering).
+        
+        The last folded bar is searched for from the tail, so both a growing
+        history and a fixed-length sliding window resume in O(new bars).
+        """
+        for pos in range(len(historical) - 1, -1, -1):
+            anchor = historical[pos]
+            if anchor['timestamp'] == state.last_ts:
+                break
+        else:
+            return None
+        if float(anchor['close']) != state.last_close:
+            return None
+        
+        new_bars = historical[pos + 1:]
+        if HAS_NUMPY:
+            # The numpy path sorts by time, so new bars must come strictly after
+            try:
+                ts = _to_datetime64([state.last_ts] + [bar['timestamp'] for bar in new_bars])
+            except (TypeError, ValueError):
                 return None
-                
-            # Calculate SMAs using simple method
-            current_fast = self._simple_sma(data, self.fast_period)
-            current_slow = self._simple_sma(data, self.slow_period)
-            prev_fast = self._simple_sma(data[:-1], self.fast_period) if len(data) > self.fast_period else current_fast
-            prev_slow = self._simple_sma(data[:-1], self.slow_period) if len(data) > self.slow_period else current_slow
-            current_price = data[-1]
-            
-            if current_fast is None or current_slow is None:
+            if not (ts[1:] > ts[:-1]).all():
                 return None
+        return new_bars
+    
+    def _push_close(self, state: SMAState, close: float) -> None:
+        """Fold one close into the running sums in O(1)."""
+        fast, slow = self.fast_period, self.slow_period
+        buf = state.closes
+        cap = len(buf)
+        head = state.head
+        if state.count >= fast:
+            state.sum_fast -= buf[head - fast]
+        if state.count >= slow:
+            state.sum_slow -= buf[head - slow]
+        buf[head] = close
+        close = buf[head]  # the float32 value actually stored
+        state.head = (head + 1) % cap
+        state.count = min(state.count + 1, cap)
+        state.sum_fast += close
+        state.sum_slow += close
         
-        # Detect crossovers
-        signal = self._detect_crossover(
-            current_fast, current_slow, prev_fast, prev_slow, 
-            current_position, symbol, current_price
-        )
+        # Re-sum once per buffer length so add/subtract rounding can't drift
+        state.pushes += 1
+        if state.pushes % cap == 0:
+            state.sum_fast = math.fsum(state.tail(min(fast, state.count)))
+            state.sum_slow = math.fsum(state.tail(min(slow, state.count)))
         
-        return signal
+        state.prev_fast, state.prev_slow = state.current_fast, state.current_slow
+        state.current_fast = state.sum_fast / fast if state.count >= fast else math.nan
+        state.current_slow = state.sum_slow / slow if state.count >= slow else math.nan
     
-    def _simple_sma(self, prices: List[float], period: int) -> float:
-        """Simple moving average calculation without numpy."""
-        if len(prices) < period:
-            return None
-        return sum(prices[-period:]) / period
+    def _simple_sma_pair(self, prices: List[float], fast: int, slow: int) -> Tuple[Optional[float], ...]:
+        """
+        Fast/slow SMAs on the last two bars without numpy, in O(period).
+        
+        Returns:
+            (fast_last, slow_last, fast_prev, slow_prev); the last values are
+            None when the history is shorter than the period, and the previous
+            values equal the last ones when there is no earlier full window.
+        """
+        n = len(prices)
+        
+        def last_and_prev(period: int) -> Tuple[Optional[float], Optional[float]]:
+            if n < period:
+                return None, None
+            last = math.fsum(prices[n - period:]) / period
+            if n == period:
+                return last, last
+            # Step the window back one bar instead of re-summing it
+            return last, last + (prices[n - period - 1] - prices[n - 1]) / period
+        
+        fast_last, fast_prev = last_and_prev(fast)
+        slow_last, slow_prev = last_and_prev(slow)
+        return fast_last, slow_last, fast_prev, slow_prev
     
-    def _create_price_dataframe(self, historical_data: List[dict]):
-        """Convert historical price data to DataFrame or simple list based on availability."""
-        
-        if HAS_PANDAS:
-            # Use pandas for optimized performance
-            data = [
-                {
-                    'timestamp': item['timestamp'],
-                    'close': float(item['close']),
-                    'volume': float(item.get('volume', 0))
-                }
-                for item in historical_data
-            ]
-            
-            df = pd.DataFrame(data)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            return df
+    def _parse_price_history(self, historical_data: Sequence) -> Tuple[Sequence[float], Optional[Sequence], float]:
+        """
+        Extract closes (and timestamps) from historical price records.
+        
+        ``historical_data`` is a list of price dicts or, with numpy, a
+        structured array with 'timestamp' (datetime64) and 'close' fields.
+        
+        With numpy available the closes come back as a float32 array sorted
+        by time, alongside the datetime64[ns] timestamps. Without it the
+        closes are a plain list in input order and no timestamps are parsed.
+        The third value is the latest bar's close at full precision, for
+        reporting.
+        """
+        if HAS_NUMPY:
+            # float32 halves the bytes the SMA sums stream through; its ~1e-7
+            # relative precision is far below a price tick, and every sum
+            # accumulates in float64
+            if isinstance(historical_data, np.ndarray):
+                # Structured array from the engine: columns are already typed
+                close = historical_data['close'].astype(np.float32)
+                ts = historical_data['timestamp'].astype('datetime64[ns]')
+            else:
+                close = np.fromiter((item['close'] for item in historical_data),
+                                    dtype=np.float32, count=len(historical_data))
+                ts = _to_datetime64([item['timestamp'] for item in historical_data])
+            last = len(historical_data) - 1
+            # Histories normally arrive in order; only sort when they don't
+            if len(ts) > 1 and not (ts[1:] >= ts[:-1]).all():
+                order = np.argsort(ts, kind='stable')
+                close, ts = close[order], ts[order]
+                last = order[-1]
+            return close, ts, float(historical_data[last]['close'])
         else:
-            # Simple fallback without pandas
-            return [float(item['close']) for item in historical_data]
+            # Simple fallback without numpy
+            close = [float(item['close']) for item in historical_data]
+            return close, None, close[-1]
     
     def _detect_crossover(self, current_fast: float, current_slow: float, 
                          prev_fast: float, prev_slow: float,
-                         current_position: float, symbol: str, current_price: float) -> Optional[dict]:
-        """Detect SMA crossover and generate appropriate signal."""
+                         current_position: float, symbol: str, current_price: float,
+                         confidence: Optional[float] = None) -> Optional[Signal]:
+        """
+        Detect SMA crossover and generate appropriate signal. ``confidence``
+        may be passed in when it was already computed for a batch.
+        """
         
         # Bullish crossover: fast SMA crosses above slow SMA
         bullish_crossover = (prev_fast <= prev_slow) and (current_fast > current_slow)
@@ -214,51 +638,30 @@ class SMAAgent(BaseAgent):
         # Bearish crossover: fast SMA crosses below slow SMA  
         bearish_crossover = (prev_fast >= prev_slow) and (current_fast < current_slow)
         
-        # Calculate position size based on risk limits
-        max_position = self.risk_limits.get('max_position_size', 10000)
-        target_position_size = min(max_position * self.position_size_pct, max_position)
-        
-        signal = None
-        
         if bullish_crossover and current_position <= 0:
             # Buy signal
+            max_position = self.risk_limits.get('max_position_size', 10000)
+            target_position_size = min(max_position * self.position_size_pct, max_position)
+            action = 'buy'
             quantity = target_position_size - current_position
-            confidence = self._calculate_confidence(current_fast, current_slow, 'buy')
-            
-            signal = {
-                'symbol': symbol,
-                'action': 'buy',
-                'quantity': quantity,
-                'confidence': confidence,
-                'reasoning': f'Fast SMA ({current_fast:.2f}) crossed above Slow SMA ({current_slow:.2f})',
-                'metadata': {
-                    'fast_sma': current_fast,
-                    'slow_sma': current_slow,
-                    'current_price': current_price,
-                    'strategy': 'sma_crossover'
-                }
-            }
-            
         elif bearish_crossover and current_position > 0:
             # Sell signal
+            action = 'sell'
             quantity = current_position  # Close entire position
-            confidence = self._calculate_confidence(current_fast, current_slow, 'sell')
-            
-            signal = {
-                'symbol': symbol,
-                'action': 'sell',
-                'quantity': quantity,
-                'confidence': confidence,
-                'reasoning': f'Fast SMA ({current_fast:.2f}) crossed below Slow SMA ({current_slow:.2f})',
-                'metadata': {
-                    'fast_sma': current_fast,
-                    'slow_sma': current_slow,
-                    'current_price': current_price,
-                    'strategy': 'sma_crossover'
-                }
-            }
+        else:
+            return None
         
-        return signal
+        if confidence is None:
+            confidence = self._calculate_confidence(current_fast, current_slow, action)
+        return Signal(
+            symbol=symbol,
+            action=action,
+            quantity=quantity,
+            confidence=confidence,
+            fast=current_fast,
+            slow=current_slow,
+            price=current_price,
+        )
     
     def _calculate_confidence(self, fast_sma: float, slow_sma: float, action: str) -> float:
         """Calculate confidence score based on SMA separation."""
@@ -274,6 +677,13 @@ class SMAAgent(BaseAgent):
         
         return confidence
     
+    @staticmethod
+    def _calculate_confidence_vec(fast_sma: "np.ndarray", slow_sma: "np.ndarray") -> "np.ndarray":
+        """_calculate_confidence over arrays of SMA pairs, without branches."""
+        degenerate = (fast_sma == 0) | (slow_sma == 0)
+        sma_diff_pct = np.abs(fast_sma - slow_sma) / np.where(slow_sma == 0, 1.0, slow_sma)
+        return np.where(degenerate, 0.5, np.minimum(0.5 + sma_diff_pct * 10, 1.0))
+    
     async def on_fill(self, fill: dict) -> None:
         """Handle order fill notifications."""
         symbol = fill.get('symbol')
@@ -291,6 +701,11 @@ class SMAAgent(BaseAgent):
         # Update internal tracking if needed
         # This is where you might update position tracking, P&L calculation, etc.
         
+    def set_risk_limits(self, limits: dict) -> None:
+        """Update risk limits; remembered signals were sized under the old ones."""
+        super().set_risk_limits(limits)
+        self._last_signals.clear()
+
     async def on_limit_update(self, limits: dict) -> None:
         """Handle risk limit updates."""
         self.set_risk_limits(limits)
@@ -302,6 +717,36 @@ class SMAAgent(BaseAgent):
             # Could trigger position size adjustments here
             pass
     
+    async def on_bar(self, symbol: str, bar: dict) -> None:
+        """
+        Handle a newly closed bar pushed by the engine.
+        
+        The bar is folded into the symbol's running SMAs right away, so the
+        next generate_signals call finds the state already current and only
+        reads the stored values. Bars for symbols without state yet, or not
+        newer than the last folded bar, are ignored; the next snapshot is
+        reconciled by the usual append check or a full recompute.
+        
+        Args:
+            symbol: Symbol the bar belongs to
+            bar: Price record with 'timestamp' and 'close'
+        """
+        state = self._sma_state.get(symbol)
+        if state is None:
+            return
+        if HAS_NUMPY:
+            try:
+                ts = _to_datetime64([state.last_ts, bar['timestamp']])
+            except (TypeError, ValueError):
+                return
+            if not ts[1] > ts[0]:
+                return
+        
+        self._push_close(state, float(bar['close']))
+        state.last_n += 1
+        state.last_ts = bar['timestamp']
+        state.last_close = float(bar['close'])
+    
     def get_performance_stats(self) -> dict:
         """Get performance statistics for the agent."""
         return {
@@ -318,8 +763,8 @@ class SMAAgent(BaseAgent):
         await super().shutdown()
         
         # Clear caches
-        self._price_cache.clear()
         self._sma_cache.clear()
+        self._sma_state.clear()
         self._last_signals.clear()
         
         self.logger.info(f"{self.name} shutdown complete")
@@ -4,23 +4,48 @@ All trading agents must inherit from this class.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple, Sequence, Tuple
 import asyncio
+import functools
 import logging
-import sys
-import os
 
-# Add tools to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-try:
-    from tools import notify_fill, register_heartbeat_source, send_heartbeat, deregister_heartbeat_source
-except ImportError:
-    # Fallback if tools not available
-    async def notify_fill(fill): return {'slack': False, 'email': False}
-    async def register_heartbeat_source(name): pass
-    async def send_heartbeat(name): pass
-    async def deregister_heartbeat_source(name): pass
+@functools.cache
+def _load_tools():
+    """
+    Import the alerting/heartbeat tools on first use, or None if they aren't
+    available. Backtests and offline runs never touch them, so importing
+    this module doesn't pay for them.
+    """
+    try:
+        import tools
+    except ImportError:
+        return None
+    return tools
+
+
+class MarketSnapshot(NamedTuple):
+    """
+    Market data snapshot as aligned per-symbol sequences.
+    
+    Equivalent to the dict snapshot's 'prices' and 'positions' entries, but
+    agents can walk symbols by position instead of looking each one up.
+    """
+    symbols: Tuple[str, ...]
+    prices: Tuple[dict, ...]
+    positions: Sequence[float]
+    
+    @classmethod
+    def from_dict(cls, snapshot: dict) -> "MarketSnapshot":
+        """Build from the engine's dict snapshot (missing positions are 0)."""
+        prices = snapshot.get('prices', {})
+        positions = snapshot.get('positions', {})
+        symbols = tuple(prices)
+        return cls(
+            symbols=symbols,
+            prices=tuple(prices.values()),
+            positions=[positions.get(symbol, 0) for symbol in symbols],
+        )
 
 
 class BaseAgent(ABC):
@@ -33,6 +58,8 @@ class BaseAgent(ABC):
     - Agent only handles signal/sizing logic and model training
     """
     
+    __slots__ = ('name', 'is_active', 'risk_limits', 'logger', '_heartbeat_registered')
+    
     def __init__(self, name: str):
         self.name = name
         self.is_active = True
@@ -108,26 +135,33 @@ class BaseAgent(ABC):
         }
     
     async def _ensure_heartbeat_registered(self) -> None:
-        """Ensure heartbeat is registered for this agent."""
-        if not self._heartbeat_registered:
+        """Ensure heartbeat is registered for this agent (no-op without tools)."""
+        tools = _load_tools()
+        if tools is not None and not self._heartbeat_registered:
             try:
-                await register_heartbeat_source(self.name)
+                await tools.register_heartbeat_source(self.name)
                 self._heartbeat_registered = True
             except Exception as e:
                 self.logger.warning(f"Failed to register heartbeat: {e}")
     
     async def _send_heartbeat(self) -> None:
         """Send heartbeat signal."""
+        tools = _load_tools()
+        if tools is None:
+            return
         try:
             await self._ensure_heartbeat_registered()
-            await send_heartbeat(self.name)
+            await tools.send_heartbeat(self.name)
         except Exception as e:
             self.logger.warning(f"Failed to send heartbeat: {e}")
     
     async def _notify_fill(self, fill: dict) -> None:
         """Send fill notification."""
+        tools = _load_tools()
+        if tools is None:
+            return
         try:
-            result = await notify_fill(fill)
+            result = await tools.notify_fill(fill)
             if result.get('slack') or result.get('email'):
                 self.logger.info(f"Fill notification sent: {result}")
         except Exception as e:
@@ -140,7 +174,7 @@ class BaseAgent(ABC):
         # Deregister heartbeat
         if self._heartbeat_registered:
             try:
-                await deregister_heartbeat_source(self.name)
+                await _load_tools().deregister_heartbeat_source(self.name)
                 self._heartbeat_registered = False
             except Exception as e:
                 self.logger.warning(f"Failed to deregister heartbeat: {e}")
@@ -171,19 +171,24 @@ class AgentExecutor:
         Returns:
             Dictionary mapping agent names to their generated signals
         """
-        self.logger.info(f"🚀 Executing {len(agents)} agents in parallel...")
+        # Shut-down agents get no coroutine, no heartbeat and no signals
+        active = [agent for agent in agents if agent.is_active]
         
-        # Execute all agents in parallel
+        self.logger.info(f"🚀 Executing {len(active)} agents in parallel...")
+        
+        # Execute all active agents in parallel
         tasks = [
             self.execute_agent_with_heartbeat(agent, snapshot)
-            for agent in agents
+            for agent in active
         ]
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        # Organize results by agent name
+        # Organize results by agent name, in the order agents were given
+        outcomes = dict(zip(map(id, active), results))
         agent_results = {}
-        for agent, result in zip(agents, results):
+        for agent in agents:
+            result = outcomes.get(id(agent), [])
             if isinstance(result, Exception):
                 self.logger.error(f"❌ Agent {agent.name} failed with exception: {result}")
                 agent_results[agent.name] = []
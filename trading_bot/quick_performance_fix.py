@@ -5,6 +5,7 @@ This script modifies the existing technical analysis to improve performance.
 """
 
 import os
+import re
 import sys
 
 def apply_performance_patches():
@@ -42,31 +43,75 @@ def apply_performance_patches():
     
     # Patch 1: Add caching decorator
     cache_decorator = '''
-_indicator_cache = {}
+import functools
+from collections import OrderedDict
+
+# cache_indicator: content-keyed LRU (v2)
+_indicator_cache = OrderedDict()
+_INDICATOR_CACHE_SIZE = 128
+_INDICATOR_CACHE_FP32 = True  # store float64 Series as float32
+
+def _compact(result):
+    """Downcast float64 Series (alone or in a tuple) to float32 for the cache."""
+    if isinstance(result, tuple):
+        return tuple(_compact(item) for item in result)
+    if isinstance(result, pd.Series) and result.dtype == np.float64:
+        return result.astype(np.float32)
+    return result
 
 def cache_indicator(func):
-    """Cache indicator calculations to avoid redundant computations."""
-    def wrapper(*args, **kwargs):
-        # Create a cache key from function name and args
-        cache_key = f"{func.__name__}_{id(args[0])}"  # args[0] is prices_df
+    """
+    Cache indicator calculations to avoid redundant computations.
+
+    Keyed on the content of the prices passed in (not their id(), which is
+    reused once a frame is garbage collected) plus the remaining arguments,
+    holding at most _INDICATOR_CACHE_SIZE results, least recently used first out.
+    """
+    @functools.wraps(func)
+    def wrapper(data, *args, **kwargs):
+        if isinstance(data, (pd.Series, pd.DataFrame)):
+            content = hash(pd.util.hash_pandas_object(data).to_numpy().tobytes())
+        else:
+            content = hash(np.ascontiguousarray(data).tobytes())
+        cache_key = (func.__name__, len(data), content, args, tuple(sorted(kwargs.items())))
         
         if cache_key in _indicator_cache:
+            _indicator_cache.move_to_end(cache_key)
             return _indicator_cache[cache_key]
         
-        result = func(*args, **kwargs)
+        result = func(data, *args, **kwargs)
+        if _INDICATOR_CACHE_FP32:
+            # Misses return the stored copy too, so results don't depend on cache state
+            result = _compact(result)
         _indicator_cache[cache_key] = result
+        if len(_indicator_cache) > _INDICATOR_CACHE_SIZE:
+            _indicator_cache.popitem(last=False)
         return result
     return wrapper
 
 '''
     
-    if '_indicator_cache' not in content:
-        # Find a good place to insert the cache decorator (after imports)
-        import_end = content.find('\n\n\n')
-        if import_end > 0:
-            content = content[:import_end] + '\n' + cache_decorator + content[import_end:]
+    # Earlier versions of this patch, including the id()-keyed cache, run
+    # from the cache dict through the end of cache_indicator
+    previous_cache = re.compile(
+        r'(?:import functools\n(?:from collections import OrderedDict\n)?\n)?'
+        r'_indicator_cache = .*?\n    return wrapper\n\n?',
+        re.DOTALL,
+    )
+    if '# cache_indicator: content-keyed LRU (v2)' not in content:
+        content, replaced = previous_cache.subn(
+            lambda match: cache_decorator.lstrip('\n'), content, count=1
+        )
+        if replaced:
             patches_applied += 1
-            print("✓ Added caching decorator")
+            print("✓ Replaced outdated caching decorator")
+        else:
+            # Find a good place to insert the cache decorator (after imports)
+            import_end = content.find('\n\n\n')
+            if import_end > 0:
+                content = content[:import_end] + '\n' + cache_decorator + content[import_end:]
+                patches_applied += 1
+                print("✓ Added caching decorator")
     
     # Patch 2: Add @cache_indicator to expensive functions
     functions_to_cache = [
@@ -78,12 +123,17 @@ def cache_indicator(func):
         'calculate_hurst_exponent'
     ]
     
-    for func_name in functions_to_cache:
-        func_def = f'def {func_name}('
-        if func_def in content and f'@cache_indicator\ndef {func_name}(' not in content:
-            content = content.replace(func_def, f'@cache_indicator\n{func_def}')
-            patches_applied += 1
-            print(f"✓ Added caching to {func_name}")
+    # One pass over the source; definitions already decorated are skipped
+    undecorated = re.compile(
+        r'^(?<!@cache_indicator\n)def (' + '|'.join(functions_to_cache) + r')\(', re.MULTILINE
+    )
+    
+    def decorate(match):
+        print(f"✓ Added caching to {match.group(1)}")
+        return '@cache_indicator\n' + match.group(0)
+    
+    content, decorated = undecorated.subn(decorate, content)
+    patches_applied += decorated
     
     # Patch 3: Optimize the Hurst exponent calculation
     hurst_optimization = '''def calculate_hurst_exponent(price_series: pd.Series, max_lag: int = 20) -> float:
@@ -104,31 +154,54 @@ def cache_indicator(func):
     if len(price_series) < max_lag * 2:
         return 0.5
     
+    prices = np.asarray(price_series, dtype=np.float64)
+    
     # Use only every nth point for large datasets to speed up calculation
-    if len(price_series) > 1000:
-        price_series = price_series[::5]  # Sample every 5th point
-        max_lag = min(max_lag, len(price_series) // 4)
+    if len(prices) > 1000:
+        prices = prices[::5]  # Sample every 5th point
+        max_lag = min(max_lag, len(prices) // 4)
     
     lags = range(2, max_lag)
+    n = len(prices)
+    # Every lag's differences go into one scratch buffer
+    buf = np.empty(n)
+    tau = np.empty(len(lags))
+    for i, lag in enumerate(lags):
+        tau[i] = np.subtract(prices[lag:], prices[:-lag], out=buf[:n - lag]).std()
     # Add small epsilon to avoid log(0)
-    tau = [max(1e-8, np.sqrt(np.std(np.subtract(price_series[lag:], price_series[:-lag])))) for lag in lags]
+    tau = np.fmax(np.sqrt(tau), 1e-8)
+
+    # The Hurst exponent is the least-squares slope of log(tau) on log(lag)
+    lx, lx_var = _hurst_log_lags(max_lag)
+    if lx_var == 0:
+        # Return 0.5 (random walk) if there are too few lags to fit
+        return 0.5
+    log_tau = np.log(tau)
+    return float((lx * (log_tau - log_tau.mean())).sum() / lx_var)
+
 
-    # Return the Hurst exponent from linear fit
-    try:
-        reg = np.polyfit(np.log(lags), np.log(tau), 1)
-        return reg[0]  # Hurst exponent is the slope
-    except (ValueError, RuntimeWarning):
-        # Return 0.5 (random walk) if calculation fails
-        return 0.5'''
+@functools.lru_cache(maxsize=8)
+def _hurst_log_lags(max_lag: int):
+    """Centered log(lag) for lags 2..max_lag-1 and its sum of squares."""
+    log_lags = np.log(np.arange(2, max_lag))
+    lx = log_lags - log_lags.mean()
+    lx.flags.writeable = False  # shared between calls
+    return lx, float((lx * lx).sum())'''
     
-    # Find and replace the Hurst function
+    # Find and replace the Hurst function, which runs up to the next top-level
+    # statement (a decorator included) or the end of the file; the helper a
+    # previous run emitted after it (older runs imported lru_cache separately)
+    # counts as part of the function
     hurst_start = content.find('def calculate_hurst_exponent(')
     if hurst_start > 0:
-        hurst_end = content.find('\n\ndef ', hurst_start)
-        if hurst_end > 0:
-            content = content[:hurst_start] + hurst_optimization + content[hurst_end:]
-            patches_applied += 1
-            print("✓ Optimized Hurst exponent calculation")
+        next_top_level = re.compile(
+            r'\n\n+(?=[^\s#])'
+            r'(?!(?:from functools import lru_cache\n\n)?@(?:functools\.)?lru_cache\(maxsize=8\)\ndef _hurst_log_lags\()'
+        ).search(content, content.find('\n', hurst_start))
+        hurst_end = next_top_level.start() if next_top_level else len(content.rstrip())
+        content = content[:hurst_start] + hurst_optimization + content[hurst_end:]
+        patches_applied += 1
+        print("✓ Optimized Hurst exponent calculation")
     
     # Patch 4: Add early data validation
     validation_code = '''
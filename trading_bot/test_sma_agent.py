@@ -7,36 +7,32 @@ import asyncio
 import time
 import sys
 import os
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
 
 # Add the trading_bot to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from trading_bot.agents.sma_agent import SMAAgent
+from trading_bot.test_sma_simple import generate_mock_price_columns
 
 
 def generate_mock_price_data(symbol: str, days: int = 100) -> dict:
     """Generate mock historical price data for testing."""
     
-    historical = []
-    base_price = 100.0
-    
-    for i in range(days):
-        # Add some randomness to create realistic price movement
-        price_change = random.uniform(-2, 2)
-        base_price = max(10, base_price + price_change)  # Don't go below $10
-        
-        timestamp = datetime.now() - timedelta(days=days-i)
-        
-        historical.append({
+    columns = generate_mock_price_columns(days)
+    closes = columns['close'].tolist()
+    
+    historical = [
+        {
             'timestamp': timestamp.isoformat(),
-            'close': base_price,
-            'volume': random.randint(1000, 10000)
-        })
+            'close': close,
+            'volume': volume
+        }
+        for timestamp, close, volume in zip(columns['timestamp'].tolist(), closes, columns['volume'].tolist())
+    ]
     
     return {
-        'current': base_price,
+        'current': closes[-1] if closes else 100.0,
         'historical': historical
     }
 
@@ -179,6 +175,9 @@ async def test_sma_agent_performance():
 
 
 if __name__ == "__main__":
-    # Run the async test
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(test_sma_agent_performance())
\ No newline at end of file
+    # Run the async test, on uvloop's faster event loop when it's installed
+    try:
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+    run(test_sma_agent_performance())
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""
+Shared utilities for the Trading Bot.
+"""
+
+from .price_cache import PriceCache
+
+__all__ = [
+    'PriceCache',
+]
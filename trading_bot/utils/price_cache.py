@@ -0,0 +1,138 @@
+"""
+On-disk cache for historical price fetches.
+Entries are JSON files keyed by (ticker, start_date, end_date) and expire
+after a fixed TTL measured from when they were written.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "trading_bot", "prices")
+
+# Entries older than this are dropped on read and pruned on write
+DEFAULT_TTL_DAYS = 90
+
+# Upper bound on stored windows; the oldest are pruned first
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class PriceCache:
+    """
+    JSON-per-window store for price records.
+
+    Windows ending today (or later) are never cached because the most recent
+    bar can still change. Older windows are reused for ``ttl_days`` after
+    being written, and every write prunes expired entries and any beyond
+    ``max_entries``, oldest first.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 ttl_days: float = DEFAULT_TTL_DAYS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize price cache.
+
+        Args:
+            cache_dir: Directory for cache files (PRICE_CACHE_DIR env or ~/.cache by default)
+            ttl_days: Age in days after which an entry is treated as a miss
+            max_entries: Maximum number of windows kept on disk
+        """
+        self.cache_dir = cache_dir or os.getenv("PRICE_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+
+    @staticmethod
+    def is_cacheable(end_date: str) -> bool:
+        """Only fully elapsed windows are safe to reuse."""
+        return end_date < date.today().isoformat()
+
+    def _path(self, ticker: str, start_date: str, end_date: str) -> str:
+        # The readable prefix is lossy ("BRK/B" and "BRK_B" share it), so the
+        # hash of the exact key keeps distinct windows in distinct files
+        digest = hashlib.sha1(json.dumps([ticker, start_date, end_date]).encode("utf-8")).hexdigest()
+        prefix = re.sub(r"[^A-Za-z0-9._-]", "_", ticker)[:32]
+        return os.path.join(self.cache_dir, f"{prefix}_{digest}.json")
+
+    def _is_expired(self, mtime: float, now: float) -> bool:
+        return now - mtime > self.ttl_seconds
+
+    def get(self, ticker: str, start_date: str, end_date: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached price records.
+
+        Returns:
+            List of price record dicts, or None on a miss or an expired entry
+        """
+        if not self.is_cacheable(end_date):
+            return None
+
+        path = self._path(ticker, start_date, end_date)
+        try:
+            if self._is_expired(os.path.getmtime(path), time.time()):
+                os.remove(path)
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable price cache entry for {ticker}: {e}")
+            return None
+
+    def set(self, ticker: str, start_date: str, end_date: str, records: List[Dict[str, Any]]) -> None:
+        """Store price records for a window (no-op for windows ending today)."""
+        if not self.is_cacheable(end_date):
+            return
+
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(records, f, default=str)
+            os.replace(tmp_path, self._path(ticker, start_date, end_date))
+            tmp_path = None
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write price cache entry for {ticker}: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+        self.prune()
+
+    def prune(self) -> None:
+        """Remove expired entries, then the oldest beyond max_entries."""
+        now = time.time()
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+        entries.sort(reverse=True)
+        for rank, (mtime, path) in enumerate(entries):
+            if rank >= self.max_entries or self._is_expired(mtime, now):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass